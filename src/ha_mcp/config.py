@@ -1,13 +1,11 @@
 """Configuration module for the Home Assistant MCP Server."""
 
-import logging
+from functools import cached_property
 from urllib.parse import urlparse
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-logger = logging.getLogger(__name__)
-
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables with HA_MCP_ prefix."""
@@ -19,18 +17,10 @@ class Settings(BaseSettings):
     port: int = 8099
     skip_confirm_default: bool = False
     log_level: str = "INFO"
+    pretty_json: bool = False
 
     model_config = SettingsConfigDict(env_prefix="HA_MCP_")
 
-    @field_validator("ha_token")
-    @classmethod
-    def warn_if_empty_token(cls, v: str) -> str:
-        if not v:
-            logger.warning(
-                "ha_token is empty. Set HA_MCP_HA_TOKEN to a long-lived access token."
-            )
-        return v
-
     @field_validator("transport")
     @classmethod
     def validate_transport(cls, v: str) -> str:
@@ -41,12 +31,12 @@ class Settings(BaseSettings):
             )
         return v
 
-    @property
+    @cached_property
     def ha_base_url(self) -> str:
         """Return ha_url with any trailing slash removed."""
         return self.ha_url.rstrip("/")
 
-    @property
+    @cached_property
     def ha_websocket_url(self) -> str:
         """Convert ha_url to a WebSocket URL and append /api/websocket."""
         parsed = urlparse(self.ha_base_url)
@@ -4,19 +4,67 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from ha_mcp.ha_client.models import (
     HAAuthError,
     HAConnectionError,
+    HAError,
     HANotFoundError,
     HAValidationError,
 )
 
+if TYPE_CHECKING:
+    from ha_mcp.ha_client.websocket import HAWebSocketClient
+
 logger = logging.getLogger(__name__)
 
+# Short-lived memo for idempotent GETs. HA state moves on quickly, so entries
+# only live long enough to absorb bursts of identical reads within one tool
+# chain; writes through this client invalidate the affected paths directly.
+_CACHE_TTL = 2.0
+# Stored configs only change on an explicit save (which invalidates them), so
+# they can be held longer to cover get -> update -> get sequences.
+_CONFIG_CACHE_TTL = 5.0
+_CACHE_MAX_ENTRIES = 500
+
+# HTTP error statuses with a dedicated exception, and their message templates.
+_STATUS_ERRORS: dict[int, tuple[type[HAError], str]] = {
+    401: (HAAuthError, "Authentication failed (401): {text}"),
+    404: (HANotFoundError, "Resource not found (404): {path} – {text}"),
+    400: (HAValidationError, "Validation error (400): {text}"),
+}
+
+# Endpoint paths. Parametrised ones are bound ``str.format`` methods so the
+# template is parsed once rather than per call.
+_STATES_PATH = "/api/states"
+_STATE_PATH = "/api/states/{}".format
+_HISTORY_PATH = "/api/history/period"
+_LOGBOOK_PATH = "/api/logbook"
+_ERROR_LOG_PATH = "/api/error_log"
+_TEMPLATE_PATH = "/api/template"
+_CHECK_CONFIG_PATH = "/api/config/core/check_config"
+_AUTOMATION_CONFIG_PATH = "/api/config/automation/config/{}".format
+_SCRIPT_CONFIG_PATH = "/api/config/script/config/{}".format
+_SCENE_CONFIG_PATH = "/api/config/scene/config/{}".format
+_SERVICE_PATH = "/api/services/{}/{}".format
+
+# Fixed endpoints whose full URLs are built once per client.
+_STATIC_PATHS = (
+    _STATES_PATH,
+    _HISTORY_PATH,
+    _LOGBOOK_PATH,
+    _ERROR_LOG_PATH,
+    _TEMPLATE_PATH,
+    _CHECK_CONFIG_PATH,
+)
+
 
 class HARestClient:
     """Async REST client wrapping the Home Assistant HTTP API.
@@ -28,21 +76,30 @@ class HARestClient:
     def __init__(self, base_url: str, token: str) -> None:
         self.base_url = base_url.rstrip("/")
         self.token = token
+        # Prebuilt URL objects let aiohttp skip re-parsing fixed endpoints.
+        self._static_urls = {
+            path: URL(f"{self.base_url}{path}") for path in _STATIC_PATHS
+        }
         self._session: aiohttp.ClientSession | None = None
-        self._semaphore = asyncio.Semaphore(5)
+        self._connect_lock = asyncio.Lock()
+        # path -> (expires_at, raw JSON body). Raw bytes are kept so each hit
+        # decodes into fresh objects that callers are free to mutate.
+        self._cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self._cache_generation = 0
+        self._state_source: HAWebSocketClient | None = None
 
     # ------------------------------------------------------------------
     # Session lifecycle
     # ------------------------------------------------------------------
 
     async def connect(self) -> None:
-        """Create the HTTP session with auth headers."""
-        self._session = aiohttp.ClientSession(
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json",
-            }
-        )
+        """Create the HTTP session up front.
+
+        Calling this is optional: the session is also created lazily on the
+        first request.
+        """
+        await self._ensure_session()
 
     async def disconnect(self) -> None:
         """Close the HTTP session."""
@@ -50,6 +107,53 @@ class HARestClient:
             await self._session.close()
             self._session = None
 
+    def use_state_cache(self, ws: HAWebSocketClient) -> None:
+        """Serve state reads from *ws*'s event-driven state cache when it is live.
+
+        Reads fall back to HTTP whenever the cache is cold or the entity is
+        not in it.
+        """
+        self._state_source = ws
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Creation is guarded by a lock so concurrent first requests share a
+        single session instead of racing to build several.
+        """
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+
+        async with self._connect_lock:
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Build the HTTP session with auth headers.
+
+        All requests go to a single HA host, so the connector keeps a
+        per-host pool of keep-alive connections that is reused for the
+        lifetime of the session instead of re-handshaking on bursts. Its
+        ``limit_per_host`` also caps concurrent requests to HA.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=5),
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            },
+        )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -57,44 +161,119 @@ class HARestClient:
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         """Make an authenticated request with error handling.
 
-        Acquires the concurrency semaphore, issues the request via *aiohttp*,
-        and translates HTTP error codes into the appropriate HA exceptions.
-
         Returns parsed JSON for JSON responses and plain text otherwise.
+        A ``json=`` body is encoded with *orjson* and sent as raw bytes.
+        """
+        content_type, body = await self._fetch(method, path, **kwargs)
+        if "json" in content_type:
+            return orjson.loads(body)
+        return body.decode("utf-8", errors="replace")
+
+    async def _fetch(
+        self, method: str, path: str, **kwargs: Any
+    ) -> tuple[str, bytes]:
+        """Issue a request and return its content type and raw body.
+
+        Issues the request via *aiohttp* and translates HTTP error codes into
+        the appropriate HA exceptions. Concurrency is bounded by the
+        connector's per-host connection limit.
         """
-        if self._session is None:
-            raise HAConnectionError("REST client is not connected – call connect() first")
+        session = await self._ensure_session()
 
-        url = f"{self.base_url}{path}"
-        logger.debug("%s %s", method.upper(), url)
+        if "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
 
-        async with self._semaphore:
-            try:
-                async with self._session.request(method, url, **kwargs) as resp:
-                    if resp.status == 401:
-                        text = await resp.text()
-                        raise HAAuthError(f"Authentication failed (401): {text}")
-                    if resp.status == 404:
-                        text = await resp.text()
-                        raise HANotFoundError(f"Resource not found (404): {path} – {text}")
-                    if resp.status == 400:
-                        text = await resp.text()
-                        raise HAValidationError(f"Validation error (400): {text}")
+        url = self._static_urls.get(path) or f"{self.base_url}{path}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s", method.upper(), url)
 
+        try:
+            async with session.request(method, url, **kwargs) as resp:
+                if resp.status >= 400:
+                    error = _STATUS_ERRORS.get(resp.status)
+                    if error is not None:
+                        exc_cls, template = error
+                        text = await resp.text()
+                        raise exc_cls(template.format(path=path, text=text))
                     resp.raise_for_status()
 
-                    content_type = resp.content_type or ""
-                    if "json" in content_type:
-                        return await resp.json()
-                    return await resp.text()
-
-            except aiohttp.ClientConnectionError as exc:
-                raise HAConnectionError(f"Connection error: {exc}") from exc
-            except aiohttp.ClientResponseError as exc:
-                # Catch any remaining non-2xx that raise_for_status() triggers
-                raise HAConnectionError(
-                    f"HTTP {exc.status} from {method.upper()} {path}: {exc.message}"
-                ) from exc
+                return resp.content_type or "", await resp.read()
+
+        except aiohttp.ClientConnectionError as exc:
+            raise HAConnectionError(f"Connection error: {exc}") from exc
+        except aiohttp.ClientResponseError as exc:
+            # Catch any remaining non-2xx that raise_for_status() triggers
+            raise HAConnectionError(
+                f"HTTP {exc.status} from {method.upper()} {path}: {exc.message}"
+            ) from exc
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            raise HAConnectionError(
+                f"Request failed: {method.upper()} {path}: {exc!r}"
+            ) from exc
+
+    async def _cached_get(self, path: str, ttl: float = _CACHE_TTL) -> Any:
+        """GET a JSON resource through the short-lived response cache.
+
+        Fresh entries are decoded straight from memory. Concurrent misses
+        for the same path share a single in-flight request.
+        """
+        return orjson.loads(await self._cached_get_raw(path, ttl))
+
+    async def _cached_get_raw(self, path: str, ttl: float = _CACHE_TTL) -> bytes:
+        """Like :meth:`_cached_get`, but return the undecoded body."""
+        entry = self._cache.get(path)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_into_cache(path, ttl))
+            self._inflight[path] = task
+            task.add_done_callback(lambda done: self._forget_inflight(path, done))
+        # Shield the shared fetch so one cancelled caller doesn't fail the rest.
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, path: str, task: asyncio.Task[bytes]) -> None:
+        # _invalidate may already have replaced the entry with a newer fetch.
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+
+    async def _fetch_into_cache(self, path: str, ttl: float) -> bytes:
+        """Fetch *path* and store the body unless it was invalidated meanwhile."""
+        generation = self._cache_generation
+        _, body = await self._fetch("GET", path)
+        if generation == self._cache_generation:
+            self._cache[path] = (time.monotonic() + ttl, body)
+            self._cache.move_to_end(path)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return body
+
+    async def _write(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Issue a mutating request and invalidate what it may have changed.
+
+        Invalidation runs after the request (even if it fails) so a read racing
+        the write cannot re-cache the old body. Writes routinely change entity
+        state too (reloads, service calls), so state entries are dropped as well.
+        """
+        try:
+            return await self._request(method, path, **kwargs)
+        finally:
+            self._invalidate(path)
+            self._invalidate(_STATES_PATH)
+
+    def _invalidate(self, prefix: str) -> None:
+        """Drop cached responses whose path starts with *prefix*.
+
+        In-flight fetches for those paths are detached too, so a read after
+        the write starts a fresh request instead of joining one that may
+        return the old body.
+        """
+        self._cache_generation += 1
+        for path in [p for p in self._cache if p.startswith(prefix)]:
+            del self._cache[path]
+        for path in [p for p in self._inflight if p.startswith(prefix)]:
+            del self._inflight[path]
 
     # ------------------------------------------------------------------
     # State endpoints
@@ -102,11 +281,45 @@ class HARestClient:
 
     async def get_states(self) -> list[dict]:
         """GET /api/states – return all entity states."""
-        return await self._request("GET", "/api/states")
+        if self._state_source is not None:
+            states = self._state_source.get_cached_states()
+            if states is not None:
+                return states
+        return await self._cached_get(_STATES_PATH)
 
     async def get_state(self, entity_id: str) -> dict:
         """GET /api/states/{entity_id} – return a single entity state."""
-        return await self._request("GET", f"/api/states/{entity_id}")
+        if self._state_source is not None:
+            state = self._state_source.get_cached_state(entity_id)
+            if state is not None:
+                return state
+        return await self._cached_get(_STATE_PATH(entity_id))
+
+    async def get_states_by_domain(self, domain: str) -> list[dict]:
+        """Return the states of all entities in *domain* (e.g. ``"automation"``).
+
+        With a live state cache this is a lookup in its per-domain index;
+        otherwise it filters a single ``/api/states`` fetch.
+        """
+        if self._state_source is not None:
+            states = self._state_source.get_cached_states_by_domain(domain)
+            if states is not None:
+                return states
+        prefix = f"{domain}."
+        return [
+            state
+            for state in await self.get_states()
+            if state["entity_id"].startswith(prefix)
+        ]
+
+    async def get_states_bulk(self, entity_ids: list[str]) -> list[dict]:
+        """Return the states of several entities from a single ``/api/states`` fetch.
+
+        Prefer this over calling :meth:`get_state` in a loop. States come
+        back in the order of *entity_ids*; unknown entities are skipped.
+        """
+        by_id = {state["entity_id"]: state for state in await self.get_states()}
+        return [by_id[eid] for eid in entity_ids if eid in by_id]
 
     # ------------------------------------------------------------------
     # History / logging
@@ -117,9 +330,17 @@ class HARestClient:
         entity_id: str | None = None,
         start_time: str | None = None,
         end_time: str | None = None,
+        *,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
     ) -> list:
-        """GET /api/history/period/{timestamp} with optional query params."""
-        path = "/api/history/period"
+        """GET /api/history/period/{timestamp} with optional query params.
+
+        ``minimal_response`` and ``no_attributes`` ask HA to trim the records
+        server-side, which shrinks large history payloads before they are
+        transferred and decoded.
+        """
+        path = _HISTORY_PATH
         if start_time:
             path = f"{path}/{start_time}"
 
@@ -128,6 +349,11 @@ class HARestClient:
             params["filter_entity_id"] = entity_id
         if end_time:
             params["end_time"] = end_time
+        # HA treats these as presence flags; the value is ignored.
+        if minimal_response:
+            params["minimal_response"] = ""
+        if no_attributes:
+            params["no_attributes"] = ""
 
         return await self._request("GET", path, params=params)
 
@@ -138,7 +364,7 @@ class HARestClient:
         end_time: str | None = None,
     ) -> list:
         """GET /api/logbook/{timestamp} with optional query params."""
-        path = "/api/logbook"
+        path = _LOGBOOK_PATH
         if start_time:
             path = f"{path}/{start_time}"
 
@@ -152,7 +378,7 @@ class HARestClient:
 
     async def get_error_log(self) -> str:
         """GET /api/error_log – return the plain-text error log."""
-        return await self._request("GET", "/api/error_log")
+        return await self._request("GET", _ERROR_LOG_PATH)
 
     # ------------------------------------------------------------------
     # Template rendering
@@ -160,7 +386,7 @@ class HARestClient:
 
     async def render_template(self, template: str) -> str:
         """POST /api/template – render a Jinja2 template on HA."""
-        return await self._request("POST", "/api/template", json={"template": template})
+        return await self._request("POST", _TEMPLATE_PATH, json={"template": template})
 
     # ------------------------------------------------------------------
     # Config check
@@ -168,7 +394,7 @@ class HARestClient:
 
     async def check_config(self) -> dict:
         """POST /api/config/core/check_config – validate HA configuration."""
-        return await self._request("POST", "/api/config/core/check_config")
+        return await self._request("POST", _CHECK_CONFIG_PATH)
 
     # ------------------------------------------------------------------
     # Automation CRUD
@@ -176,20 +402,20 @@ class HARestClient:
 
     async def get_automation_config(self, automation_id: str) -> dict:
         """GET /api/config/automation/config/{id}."""
-        return await self._request(
-            "GET", f"/api/config/automation/config/{automation_id}"
+        return await self._cached_get(
+            _AUTOMATION_CONFIG_PATH(automation_id), _CONFIG_CACHE_TTL
         )
 
     async def save_automation_config(self, automation_id: str, config: dict) -> None:
         """POST /api/config/automation/config/{id}."""
-        await self._request(
-            "POST", f"/api/config/automation/config/{automation_id}", json=config
+        await self._write(
+            "POST", _AUTOMATION_CONFIG_PATH(automation_id), json=config
         )
 
     async def delete_automation_config(self, automation_id: str) -> None:
         """DELETE /api/config/automation/config/{id}."""
-        await self._request(
-            "DELETE", f"/api/config/automation/config/{automation_id}"
+        await self._write(
+            "DELETE", _AUTOMATION_CONFIG_PATH(automation_id)
         )
 
     # ------------------------------------------------------------------
@@ -198,20 +424,26 @@ class HARestClient:
 
     async def get_script_config(self, script_id: str) -> dict:
         """GET /api/config/script/config/{id}."""
-        return await self._request(
-            "GET", f"/api/config/script/config/{script_id}"
+        return await self._cached_get(
+            _SCRIPT_CONFIG_PATH(script_id), _CONFIG_CACHE_TTL
+        )
+
+    async def get_script_config_raw(self, script_id: str) -> bytes:
+        """GET /api/config/script/config/{id} as the raw JSON body."""
+        return await self._cached_get_raw(
+            _SCRIPT_CONFIG_PATH(script_id), _CONFIG_CACHE_TTL
         )
 
     async def save_script_config(self, script_id: str, config: dict) -> None:
         """POST /api/config/script/config/{id}."""
-        await self._request(
-            "POST", f"/api/config/script/config/{script_id}", json=config
+        await self._write(
+            "POST", _SCRIPT_CONFIG_PATH(script_id), json=config
         )
 
     async def delete_script_config(self, script_id: str) -> None:
         """DELETE /api/config/script/config/{id}."""
-        await self._request(
-            "DELETE", f"/api/config/script/config/{script_id}"
+        await self._write(
+            "DELETE", _SCRIPT_CONFIG_PATH(script_id)
         )
 
     # ------------------------------------------------------------------
@@ -220,20 +452,26 @@ class HARestClient:
 
     async def get_scene_config(self, scene_id: str) -> dict:
         """GET /api/config/scene/config/{id}."""
-        return await self._request(
-            "GET", f"/api/config/scene/config/{scene_id}"
+        return await self._cached_get(
+            _SCENE_CONFIG_PATH(scene_id), _CONFIG_CACHE_TTL
+        )
+
+    async def get_scene_config_raw(self, scene_id: str) -> bytes:
+        """GET /api/config/scene/config/{id} as the raw JSON body."""
+        return await self._cached_get_raw(
+            _SCENE_CONFIG_PATH(scene_id), _CONFIG_CACHE_TTL
         )
 
     async def save_scene_config(self, scene_id: str, config: dict) -> None:
         """POST /api/config/scene/config/{id}."""
-        await self._request(
-            "POST", f"/api/config/scene/config/{scene_id}", json=config
+        await self._write(
+            "POST", _SCENE_CONFIG_PATH(scene_id), json=config
         )
 
     async def delete_scene_config(self, scene_id: str) -> None:
         """DELETE /api/config/scene/config/{id}."""
-        await self._request(
-            "DELETE", f"/api/config/scene/config/{scene_id}"
+        await self._write(
+            "DELETE", _SCENE_CONFIG_PATH(scene_id)
         )
 
     # ------------------------------------------------------------------
@@ -244,8 +482,8 @@ class HARestClient:
         self, domain: str, service: str, data: dict | None = None
     ) -> list[dict]:
         """POST /api/services/{domain}/{service} – call a HA service."""
-        return await self._request(
+        return await self._write(
             "POST",
-            f"/api/services/{domain}/{service}",
+            _SERVICE_PATH(domain, service),
             json=data or {},
         )
@@ -4,14 +4,34 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import aiohttp
+import orjson
 
 from ha_mcp.ha_client.models import HAAuthError, HAConnectionError, HAConnectionLost
 
 logger = logging.getLogger(__name__)
 
+# Size of the response slot table. Must be a power of two. It only needs to
+# exceed the usual number of in-flight commands: the semaphore admits 10
+# callers, but a send_commands batch holds one permit for all its commands.
+# A command whose slot is still taken goes to the overflow dict instead.
+_SLOT_COUNT = 1024
+_SLOT_MASK = _SLOT_COUNT - 1
+
+# How long reload() waits for more reload requests of the same domain.
+_RELOAD_DEBOUNCE = 0.05
+
+EventHandler = Callable[[dict[str, Any]], None]
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    """Mark *task*'s exception as retrieved, in case nothing awaits it."""
+    if not task.cancelled():
+        task.exception()
+
 
 class HAWebSocketClient:
     """Async WebSocket client that maintains a persistent connection to Home Assistant.
@@ -19,9 +39,13 @@ class HAWebSocketClient:
     Features:
     - Automatic authentication on connect
     - Auto-incrementing message IDs with future-based response routing
+      through a preallocated slot table indexed by ``msg_id``
     - Background listener task for incoming messages
     - Exponential-backoff reconnection on disconnect
-    - Concurrency limiting via semaphore (max 10 in-flight commands)
+    - Concurrency limiting via semaphore (max 10 concurrent senders; a
+      ``send_commands`` batch counts once however many commands it holds)
+    - Event subscriptions that survive reconnects, including a local
+      entity state cache kept current from ``state_changed`` events
     """
 
     def __init__(self, url: str, token: str) -> None:
@@ -30,6 +54,11 @@ class HAWebSocketClient:
         self._session: aiohttp.ClientSession | None = None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._msg_id: int = 0
+        # Futures awaiting a response live in a fixed slot table indexed by
+        # ``msg_id & _SLOT_MASK``; ``_pending`` only holds the rare overflow
+        # when a slot is still occupied by an older command.
+        self._slots: list[asyncio.Future[dict[str, Any]] | None] = [None] * _SLOT_COUNT
+        self._slot_ids: list[int] = [0] * _SLOT_COUNT
         self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
         self._listener_task: asyncio.Task[None] | None = None
         self._connected: bool = False
@@ -37,6 +66,23 @@ class HAWebSocketClient:
         self._reconnect_delay: float = 1.0
         self._max_reconnect_delay: float = 60.0
         self._should_reconnect: bool = True
+        # Declared subscriptions, re-established on every (re)connect, and
+        # the handlers for the current connection keyed by subscription id.
+        self._subscriptions: list[tuple[str | None, EventHandler]] = [
+            ("state_changed", self._on_state_changed)
+        ]
+        self._event_handlers: dict[int, EventHandler] = {}
+        self._state_cache: dict[str, dict[str, Any]] = {}
+        # The same states grouped by domain: domain -> entity_id -> state.
+        self._domain_index: dict[str, dict[str, dict[str, Any]]] = {}
+        self._state_cache_ready: bool = False
+        # Debounced reloads not yet sent, keyed by domain.
+        self._pending_reloads: dict[str, asyncio.Task[None]] = {}
+        self.ha_version: str | None = None
+        # Bumped on every successful (re)connect. Events fired while the
+        # connection was down are lost, so caches kept current by events
+        # must not trust data from an earlier epoch.
+        self.connection_epoch: int = 0
 
     # -- public API -----------------------------------------------------------
 
@@ -61,14 +107,17 @@ class HAWebSocketClient:
 
         await self._authenticate()
         self._connected = True
+        self.connection_epoch += 1
         self._reconnect_delay = 1.0
         self._listener_task = asyncio.create_task(self._listener())
         logger.info("Connected to Home Assistant WebSocket API at %s", self.url)
+        await self._start_subscriptions()
 
     async def disconnect(self) -> None:
         """Gracefully disconnect from the WebSocket."""
         self._should_reconnect = False
         self._connected = False
+        self._state_cache_ready = False
 
         if self._listener_task is not None:
             self._listener_task.cancel()
@@ -87,12 +136,7 @@ class HAWebSocketClient:
             self._session = None
 
         # Cancel any pending futures so callers aren't stuck waiting.
-        for future in self._pending.values():
-            if not future.done():
-                future.set_exception(
-                    HAConnectionLost("WebSocket disconnected while awaiting response")
-                )
-        self._pending.clear()
+        self._fail_pending("WebSocket disconnected while awaiting response")
 
         logger.info("Disconnected from Home Assistant WebSocket API")
 
@@ -119,41 +163,148 @@ class HAWebSocketClient:
 
         async with self._semaphore:
             self._msg_id += 1
-            msg_id = self._msg_id
+            return await self._roundtrip(self._msg_id, msg_type, kwargs, timeout)
+
+    async def send_commands(
+        self,
+        commands: Sequence[dict[str, Any]],
+        *,
+        timeout: float = 30.0,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Send several commands in one burst and wait for all responses.
+
+        Frames are written back-to-back under a single semaphore permit, so
+        fanning out N commands costs one pipelined write burst rather than N
+        separate send/await cycles. N is not capped; commands beyond the
+        free response slots are tracked in the overflow dict.
 
-            loop = asyncio.get_running_loop()
-            future: asyncio.Future[dict[str, Any]] = loop.create_future()
-            self._pending[msg_id] = future
+        Args:
+            commands: Messages without ``id``, each with at least a ``type``
+                key (e.g. ``{"type": "blueprint/list", "domain": "script"}``).
+            timeout: Maximum seconds to wait for the whole batch (default 30).
+                Commands still unanswered by then fail with TimeoutError.
+            return_exceptions: Like :func:`asyncio.gather` – return failed
+                commands' exceptions in place of their results instead of
+                raising the first one (in command order).
+
+        Returns:
+            The ``result`` payloads, in the same order as *commands*.
+
+        Raises:
+            HAConnectionError: If the client is not connected or a command fails.
+            HAConnectionLost: If the connection drops while waiting.
+            asyncio.TimeoutError: If a command is unanswered after *timeout*.
+        """
+        if not commands:
+            return []
+        if not self._connected or self._ws is None or self._ws.closed:
+            raise HAConnectionError("Not connected to Home Assistant")
 
-            message: dict[str, Any] = {"id": msg_id, "type": msg_type, **kwargs}
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            msg_ids: list[int] = []
+            futures: list[asyncio.Future[dict[str, Any]]] = []
+            frames: list[str] = []
+            for command in commands:
+                self._msg_id += 1
+                msg_id = self._msg_id
+                future: asyncio.Future[dict[str, Any]] = loop.create_future()
+                self._track(msg_id, future)
+                msg_ids.append(msg_id)
+                futures.append(future)
+                frames.append(orjson.dumps({**command, "id": msg_id}).decode())
 
             try:
-                await self._ws.send_json(message)
-                logger.debug("Sent message id=%d type=%s", msg_id, msg_type)
-            except Exception as exc:
-                self._pending.pop(msg_id, None)
-                raise HAConnectionLost(
-                    f"Failed to send message: {exc}"
-                ) from exc
+                try:
+                    for frame in frames:
+                        await self._ws.send_str(frame)
+                except Exception as exc:
+                    raise HAConnectionLost(
+                        f"Failed to send message: {exc}"
+                    ) from exc
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Sent %d messages id=%d..%d",
+                        len(frames),
+                        msg_ids[0],
+                        msg_ids[-1],
+                    )
 
+                await asyncio.wait(futures, timeout=timeout)
+            finally:
+                for msg_id in msg_ids:
+                    self._untrack(msg_id)
+
+        # Every outcome is collected first so no failed future goes unretrieved.
+        results: list[Any] = []
+        for command, future in zip(commands, futures):
+            if not future.done():
+                results.append(asyncio.TimeoutError(
+                    f"No response to {command['type']} within {timeout}s"
+                ))
+                continue
             try:
-                response = await asyncio.wait_for(future, timeout=timeout)
-            except asyncio.TimeoutError:
-                self._pending.pop(msg_id, None)
-                raise
-            except asyncio.CancelledError:
-                self._pending.pop(msg_id, None)
-                raise
+                results.append(self._unwrap(command["type"], future.result()))
+            except (HAConnectionError, HAConnectionLost) as exc:
+                results.append(exc)
+        if not return_exceptions:
+            for outcome in results:
+                if isinstance(outcome, Exception):
+                    raise outcome
+        return results
+
+    async def subscribe_events(
+        self, handler: EventHandler, event_type: str | None = None
+    ) -> None:
+        """Call *handler* with every event of *event_type* (all events if None).
+
+        The handler runs inside the listener task and receives the ``event``
+        payload; it must not block. The subscription is re-established
+        automatically after a reconnect.
+        """
+        self._subscriptions.append((event_type, handler))
+        if self._connected:
+            await self._subscribe(event_type, handler)
 
-            if not response.get("success", True):
-                error = response.get("error", {})
-                code = error.get("code", "unknown")
-                error_message = error.get("message", "Unknown error")
-                raise HAConnectionError(
-                    f"Command {msg_type} failed [{code}]: {error_message}"
-                )
+    async def reload(self, domain: str) -> None:
+        """Call ``<domain>.reload``, coalescing requests made close together.
 
-            return response.get("result", response)
+        Reloads of the same domain requested within ``_RELOAD_DEBOUNCE``
+        seconds share one ``call_service`` command. Every caller waits for
+        that reload to finish and sees its error, if any.
+        """
+        task = self._pending_reloads.get(domain)
+        if task is None:
+            task = asyncio.ensure_future(self._debounced_reload(domain))
+            # If every caller is cancelled, nobody retrieves the error.
+            task.add_done_callback(_consume_exception)
+            self._pending_reloads[domain] = task
+        # Shield the shared reload so one cancelled caller doesn't fail the rest.
+        await asyncio.shield(task)
+
+    def get_cached_state(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the cached state of *entity_id*, or None if unknown.
+
+        Also returns None while the cache is not live (not yet loaded or the
+        connection is down), so callers can fall back to a REST fetch. The
+        returned dict is shared with the cache and must not be mutated.
+        """
+        if not self._state_cache_ready:
+            return None
+        return self._state_cache.get(entity_id)
+
+    def get_cached_states(self) -> list[dict[str, Any]] | None:
+        """Return all cached entity states, or None while the cache is not live."""
+        if not self._state_cache_ready:
+            return None
+        return list(self._state_cache.values())
+
+    def get_cached_states_by_domain(self, domain: str) -> list[dict[str, Any]] | None:
+        """Return the cached states in *domain*, or None while the cache is not live."""
+        if not self._state_cache_ready:
+            return None
+        return list(self._domain_index.get(domain, {}).values())
 
     @property
     def connected(self) -> bool:  # noqa: D401
@@ -162,6 +313,117 @@ class HAWebSocketClient:
 
     # -- internals ------------------------------------------------------------
 
+    async def _roundtrip(
+        self, msg_id: int, msg_type: str, fields: dict[str, Any], timeout: float
+    ) -> Any:
+        """Send one command under an already-allocated *msg_id* and await its result."""
+        assert self._ws is not None  # noqa: S101
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._track(msg_id, future)
+
+        message: dict[str, Any] = {"id": msg_id, "type": msg_type, **fields}
+
+        try:
+            await self._ws.send_str(orjson.dumps(message).decode())
+        except Exception as exc:
+            self._untrack(msg_id)
+            raise HAConnectionLost(
+                f"Failed to send message: {exc}"
+            ) from exc
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent message id=%d type=%s", msg_id, msg_type)
+
+        try:
+            async with asyncio.timeout(timeout):
+                response = await future
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._untrack(msg_id)
+            raise
+
+        return self._unwrap(msg_type, response)
+
+    async def _debounced_reload(self, domain: str) -> None:
+        """Wait out the debounce window, then send one reload for *domain*."""
+        await asyncio.sleep(_RELOAD_DEBOUNCE)
+        # Requests arriving from here on may follow a change this reload
+        # misses, so they start a new one.
+        del self._pending_reloads[domain]
+        await self.send_command("call_service", domain=domain, service="reload")
+
+    async def _subscribe(self, event_type: str | None, handler: EventHandler) -> None:
+        """Send ``subscribe_events`` and route its events to *handler*.
+
+        The handler is registered before the command is sent so events that
+        follow the result message immediately are not dropped.
+        """
+        if not self._connected or self._ws is None or self._ws.closed:
+            raise HAConnectionError("Not connected to Home Assistant")
+
+        fields = {"event_type": event_type} if event_type else {}
+        async with self._semaphore:
+            self._msg_id += 1
+            msg_id = self._msg_id
+            self._event_handlers[msg_id] = handler
+            try:
+                await self._roundtrip(msg_id, "subscribe_events", fields, 30.0)
+            except BaseException:
+                self._event_handlers.pop(msg_id, None)
+                raise
+
+    async def _start_subscriptions(self) -> None:
+        """(Re)establish event subscriptions and seed the state cache.
+
+        Subscribing to ``state_changed`` before fetching the snapshot means no
+        change can slip between the two. Failures are logged rather than
+        raised: the client stays usable and the cache simply stays cold.
+        """
+        self._event_handlers.clear()
+        try:
+            await asyncio.gather(
+                *(self._subscribe(et, h) for et, h in self._subscriptions)
+            )
+            states = await self.send_command("get_states")
+        except (HAConnectionError, HAConnectionLost, asyncio.TimeoutError) as exc:
+            logger.warning("Could not start event subscriptions: %s", exc)
+            return
+
+        self._state_cache = {state["entity_id"]: state for state in states}
+        self._domain_index = {}
+        for entity_id, state in self._state_cache.items():
+            domain = entity_id.partition(".")[0]
+            self._domain_index.setdefault(domain, {})[entity_id] = state
+        self._state_cache_ready = True
+        logger.debug("State cache loaded with %d entities", len(states))
+
+    def _on_state_changed(self, event: dict[str, Any]) -> None:
+        """Apply a ``state_changed`` event to the state cache."""
+        entity_id = event["data"]["entity_id"]
+        new_state = event["data"].get("new_state")
+        domain = entity_id.partition(".")[0]
+        if new_state is None:
+            self._state_cache.pop(entity_id, None)
+            bucket = self._domain_index.get(domain)
+            if bucket is not None:
+                bucket.pop(entity_id, None)
+        else:
+            self._state_cache[entity_id] = new_state
+            self._domain_index.setdefault(domain, {})[entity_id] = new_state
+
+    @staticmethod
+    def _unwrap(msg_type: str, response: dict[str, Any]) -> Any:
+        """Return the ``result`` of *response*, raising if HA reported failure."""
+        if not response.get("success", True):
+            error = response.get("error", {})
+            code = error.get("code", "unknown")
+            error_message = error.get("message", "Unknown error")
+            raise HAConnectionError(
+                f"Command {msg_type} failed [{code}]: {error_message}"
+            )
+
+        return response.get("result", response)
+
     async def _authenticate(self) -> None:
         """Perform the auth handshake after connecting.
 
@@ -173,19 +435,22 @@ class HAWebSocketClient:
         assert self._ws is not None  # noqa: S101
 
         # Step 1: receive auth_required
-        auth_required = await self._ws.receive_json()
+        auth_required = await self._ws.receive_json(loads=orjson.loads)
         if auth_required.get("type") != "auth_required":
             raise HAConnectionError(
                 f"Expected auth_required but got: {auth_required.get('type')}"
             )
 
         # Step 2: send auth
-        await self._ws.send_json({"type": "auth", "access_token": self.token})
+        await self._ws.send_str(
+            orjson.dumps({"type": "auth", "access_token": self.token}).decode()
+        )
 
         # Step 3: receive auth result
-        auth_result = await self._ws.receive_json()
+        auth_result = await self._ws.receive_json(loads=orjson.loads)
         result_type = auth_result.get("type")
         if result_type == "auth_ok":
+            self.ha_version = auth_result.get("ha_version")
             logger.debug("Authentication successful")
             return
         if result_type == "auth_invalid":
@@ -196,21 +461,75 @@ class HAWebSocketClient:
             f"Unexpected auth response type: {result_type}"
         )
 
+    def _track(self, msg_id: int, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Register *future* as the receiver of the response to *msg_id*."""
+        slot = msg_id & _SLOT_MASK
+        if self._slots[slot] is None:
+            self._slots[slot] = future
+            self._slot_ids[slot] = msg_id
+        else:
+            self._pending[msg_id] = future
+
+    def _untrack(self, msg_id: int) -> asyncio.Future[dict[str, Any]] | None:
+        """Remove and return the future registered for *msg_id*, if any."""
+        slot = msg_id & _SLOT_MASK
+        if self._slot_ids[slot] == msg_id:
+            future = self._slots[slot]
+            self._slots[slot] = None
+            self._slot_ids[slot] = 0
+            return future
+        return self._pending.pop(msg_id, None)
+
+    def _fail_pending(self, reason: str) -> None:
+        """Fail every future still awaiting a response with HAConnectionLost.
+
+        The slot table and overflow dict are swapped for fresh ones first, so
+        anything that runs as the futures resolve sees empty tables rather
+        than the ones being drained.
+        """
+        slots, self._slots = self._slots, [None] * _SLOT_COUNT
+        self._slot_ids = [0] * _SLOT_COUNT
+        pending, self._pending = self._pending, {}
+        for future in (*filter(None, slots), *pending.values()):
+            if not future.done():
+                future.set_exception(HAConnectionLost(reason))
+
     async def _listener(self) -> None:
         """Background task: read incoming messages and route them to pending futures."""
         assert self._ws is not None  # noqa: S101
+        # Hot names bound once; this loop runs for every event HA pushes.
+        ws = self._ws
+        loads = orjson.loads
+        untrack = self._untrack
+        handlers = self._event_handlers
+        text_type = aiohttp.WSMsgType.TEXT
         try:
-            async for raw_msg in self._ws:
-                if raw_msg.type == aiohttp.WSMsgType.TEXT:
-                    msg: dict[str, Any] = raw_msg.json()
+            async for raw_msg in ws:
+                if raw_msg.type == text_type:
+                    msg: dict[str, Any] = loads(raw_msg.data)
                     msg_id = msg.get("id")
-                    if msg_id is not None and msg_id in self._pending:
-                        future = self._pending.pop(msg_id)
-                        if not future.done():
-                            future.set_result(msg)
-                    elif msg.get("type") == "event":
-                        # Event messages (subscriptions) - log for now.
-                        logger.debug("Received event: %s", msg.get("event", {}).get("event_type"))
+                    if msg_id is not None:
+                        future = untrack(msg_id)
+                        if future is not None:
+                            if not future.done():
+                                future.set_result(msg)
+                            continue
+                        handler = handlers.get(msg_id)
+                        if handler is not None and msg.get("type") == "event":
+                            try:
+                                handler(msg["event"])
+                            except Exception:
+                                logger.exception("Event handler failed")
+                            continue
+                    if not logger.isEnabledFor(logging.DEBUG):
+                        continue
+                    if msg.get("type") == "event":
+                        # Events for subscriptions we no longer track.
+                        event = msg.get("event")
+                        logger.debug(
+                            "Received event: %s",
+                            event.get("event_type") if event else None,
+                        )
                     else:
                         logger.debug("Unhandled message: %s", msg)
                 elif raw_msg.type in (
@@ -233,14 +552,10 @@ class HAWebSocketClient:
 
         # If we reach here the connection dropped.
         self._connected = False
+        self._state_cache_ready = False
 
         # Fail all pending futures so callers don't hang.
-        for future in self._pending.values():
-            if not future.done():
-                future.set_exception(
-                    HAConnectionLost("Connection lost while awaiting response")
-                )
-        self._pending.clear()
+        self._fail_pending("Connection lost while awaiting response")
 
         if self._should_reconnect:
             await self._reconnect()
@@ -266,12 +581,14 @@ class HAWebSocketClient:
                 self._ws = await self._session.ws_connect(self.url)
                 await self._authenticate()
                 self._connected = True
+                self.connection_epoch += 1
                 self._reconnect_delay = 1.0
                 logger.info("Reconnected to Home Assistant WebSocket API")
                 # Restart the listener loop (we're already inside the old
                 # listener task, so just call _listener recursively-ish via a
                 # new task and return).
                 self._listener_task = asyncio.create_task(self._listener())
+                await self._start_subscriptions()
                 return
             except Exception:
                 logger.exception("Reconnection attempt failed")
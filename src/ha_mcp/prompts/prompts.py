@@ -1,5 +1,194 @@
 """MCP Prompt templates for guided Home Assistant workflows."""
 
+# Prompt bodies are built once at import; each call only fills in the
+# user-supplied values with a single ``str.format``.
+
+_WIZARD_AREA_WITH = (
+    "\n2. List the available devices and entities in the '{area}' area "
+    "by reading the ha://areas resource, then filtering ha://entities and "
+    "ha://devices to that area. Present a summary so the user can confirm "
+    "which entities to use."
+)
+
+_WIZARD_AREA_WITHOUT = (
+    "\n2. If the description mentions a room or area, list the available "
+    "devices and entities there by reading ha://areas, ha://entities, and "
+    "ha://devices. Otherwise, identify the relevant entities from the "
+    "description and look them up via ha://states."
+)
+
+_WIZARD_TEMPLATE = (
+    "Help me create a Home Assistant automation based on this description:\n"
+    "\"{description}\"\n\n"
+    "Follow these steps carefully:\n\n"
+    "1. Parse the description above and identify the intended trigger(s), "
+    "condition(s), and action(s). Summarize your understanding and ask for "
+    "confirmation before proceeding."
+    "{area_instruction}\n"
+    "3. Build the complete automation configuration with proper trigger, "
+    "condition, and action sections. Use the correct entity IDs discovered "
+    "in the previous step. Choose appropriate trigger platforms (state, time, "
+    "numeric_state, event, etc.) based on the description.\n"
+    "4. Validate the automation configuration using the validate_automation_config "
+    "tool to catch any errors before creating it.\n"
+    "5. Create the automation using the create_automation tool. Present the "
+    "dry-run result and ask for confirmation before finalizing.\n\n"
+    "Important: At each step, explain what you are doing and why. If anything "
+    "is ambiguous in the description, ask for clarification rather than guessing."
+)
+
+_DASHBOARD_AREA_FILTER = (
+    " Focus specifically on the '{area}' area. Filter entities "
+    "and devices to only those assigned to this area."
+)
+
+_DASHBOARD_AREA_ENTITIES = " Filter to entities in the specified area."
+
+_DASHBOARD_TEMPLATE = (
+    "Help me design and build a Lovelace dashboard for Home Assistant."
+    "{area_filter}\n\n"
+    "Follow these steps:\n\n"
+    "1. List the relevant entities by reading ha://entities and ha://states."
+    "{area_entities} "
+    "Group them by domain (lights, sensors, climate, media_player, etc.) "
+    "and present a summary of what is available.\n"
+    "2. Based on the available entities, suggest a dashboard layout. Consider:\n"
+    "   - A status overview section with key sensors and states\n"
+    "   - Control cards for lights, switches, and climate devices\n"
+    "   - Sensor history graphs for temperature, humidity, energy, etc.\n"
+    "   - Media player controls if applicable\n"
+    "   - Camera feeds if available\n"
+    "   Present the proposed layout and ask for feedback before proceeding.\n"
+    "3. Build the complete Lovelace dashboard YAML configuration using "
+    "appropriate card types (entities, glance, history-graph, "
+    "media-control, picture-entity, thermostat, etc.). Use proper views "
+    "and organize cards logically.\n"
+    "4. Save the dashboard using the create_dashboard tool. Present the "
+    "dry-run result for review and ask for confirmation before finalizing.\n\n"
+    "Aim for a clean, functional layout. Ask about preferences (dark theme, "
+    "compact layout, specific card styles) before building."
+)
+
+_HELPER_AUTOMATION_TEMPLATE = (
+    "Help me create a '{helper_type}' input helper for the following purpose: "
+    "\"{purpose}\"\n\n"
+    "Then create an automation that uses this helper.\n\n"
+    "Follow these steps:\n\n"
+    "1. Create the appropriate input helper using the create_helper tool. "
+    "Based on the helper type '{helper_type}', configure it with:\n"
+    "   - A descriptive name and entity ID derived from the purpose\n"
+    "   - Appropriate options, min/max values, or defaults for the helper type\n"
+    "   - An icon that matches the purpose\n"
+    "   Present the helper configuration for review before creating it.\n"
+    "2. Create an automation that uses this helper as a trigger, condition, "
+    "or part of its action logic. The automation should:\n"
+    "   - Trigger when the helper value changes (or at a time set by the "
+    "helper, if it is a datetime/time helper)\n"
+    "   - Perform actions that align with the stated purpose\n"
+    "   - Use the helper's value in templates where appropriate\n"
+    "   Present the automation configuration for review before creating it.\n"
+    "3. Verify both the helper and automation were created successfully by:\n"
+    "   - Checking the helper state via ha://states\n"
+    "   - Retrieving the automation config with get_automation\n"
+    "   - Confirming the automation references the helper entity correctly\n\n"
+    "Explain at each step how the helper and automation work together."
+)
+
+
+_OPTIMIZE_PROMPT = (
+    "Perform a comprehensive review of all Home Assistant automations and "
+    "suggest improvements.\n\n"
+    "Follow these steps:\n\n"
+    "1. List all existing automations by reading the ha://automations resource. "
+    "Retrieve their full configurations with the get_all_automation_configs "
+    "tool; while its result has truncated set, call it again with offset "
+    "advanced by limit to get the rest.\n"
+    "2. Run the detect_automation_conflicts tool to identify any automations "
+    "that may conflict with each other (overlapping triggers acting on the "
+    "same entities, contradictory actions, race conditions). Present any "
+    "conflicts found with explanations.\n"
+    "3. Analyze automation coverage using the analyze_automation_coverage tool. "
+    "Identify areas or devices that have no automations, entities that are "
+    "used in triggers but never in actions (or vice versa), and common "
+    "automation patterns that are missing.\n"
+    "4. For each automation, suggest specific improvements such as:\n"
+    "   - Adding conditions to prevent unnecessary runs\n"
+    "   - Consolidating duplicate or near-duplicate automations\n"
+    "   - Improving trigger specificity to reduce false activations\n"
+    "   - Adding error handling or fallback actions\n"
+    "   - Optimizing execution order\n\n"
+    "Present a prioritized summary of all findings with actionable "
+    "recommendations. For each suggestion, explain the benefit and offer "
+    "to implement it."
+)
+
+_BLUEPRINT_IMPORT_URL = (
+    "1. Import the blueprint from the provided URL:\n"
+    "   {url}\n"
+    "   Use the import_blueprint tool to fetch and install it. "
+    "Report whether the import succeeded and show the blueprint metadata."
+)
+
+_BLUEPRINT_IMPORT_LIST = (
+    "1. List existing blueprints by reading the ha://blueprints/automation "
+    "and ha://blueprints/script resources. Present them in a clear list "
+    "with their names, descriptions, and domains. Ask the user which "
+    "blueprint they want to configure, or if they want to import a new "
+    "one by URL."
+)
+
+_BLUEPRINT_TEMPLATE = (
+    "Help me import and configure a Home Assistant blueprint.\n\n"
+    "Follow these steps:\n\n"
+    "{import_step}\n"
+    "2. Retrieve and display the blueprint's input schema. For each input, "
+    "show:\n"
+    "   - The input name and description\n"
+    "   - Whether it is required or optional\n"
+    "   - The expected type (entity, device, area, number, text, etc.)\n"
+    "   - Any default values or selectors\n"
+    "3. Help the user configure each input by:\n"
+    "   - Suggesting appropriate entities/devices from ha://entities and "
+    "ha://devices that match the input's selector type\n"
+    "   - Explaining what each input does in plain language\n"
+    "   - Validating that chosen values are compatible\n"
+    "4. Create the automation or script from the blueprint using the "
+    "appropriate creation tool with the configured inputs. Present the "
+    "dry-run result and ask for confirmation.\n\n"
+    "Make sure to explain what the blueprint does overall before diving "
+    "into configuration details."
+)
+
+_TROUBLESHOOT_TEMPLATE = (
+    "Help me troubleshoot the automation '{automation_id}'.\n\n"
+    "Follow these diagnostic steps:\n\n"
+    "1. Retrieve the full automation configuration using the get_automation "
+    "tool with entity_id '{automation_id}'. Display the trigger(s), "
+    "condition(s), and action(s) in a readable format.\n"
+    "2. Validate the automation configuration using validate_automation_config "
+    "to check for structural errors, missing required fields, or invalid "
+    "values. Report any validation errors found.\n"
+    "3. Check the current state of all entities referenced in the automation's "
+    "triggers and conditions. For each entity:\n"
+    "   - Show its current state and attributes\n"
+    "   - Verify the entity exists and is available\n"
+    "   - Check if the trigger conditions could currently be met\n"
+    "4. Check the logbook for recent executions of this automation using the "
+    "get_logbook tool. Look for:\n"
+    "   - When it last ran (or if it has never run)\n"
+    "   - Whether runs completed successfully or failed\n"
+    "   - The frequency of runs (too often may indicate a trigger issue)\n"
+    "5. Check the Home Assistant error log using the get_error_log tool for "
+    "any errors or warnings related to this automation or its referenced "
+    "entities. Filter for relevant entries.\n"
+    "6. Based on all findings, provide a diagnosis:\n"
+    "   - Identify the most likely cause of the problem\n"
+    "   - Suggest specific fixes with updated configuration if needed\n"
+    "   - Offer to apply the fixes using the update_automation tool\n\n"
+    "Be thorough and check each step even if an earlier step reveals an "
+    "obvious issue -- there may be multiple problems."
+)
+
 
 def register_prompts(mcp_server):
     """Register all MCP prompt templates with the server."""
@@ -7,204 +196,46 @@ def register_prompts(mcp_server):
     @mcp_server.prompt()
     def create_automation_wizard(description: str, area: str = "") -> str:
         """Guided workflow to create a Home Assistant automation from a natural language description."""
-        area_instruction = ""
         if area:
-            area_instruction = (
-                f"\n2. List the available devices and entities in the '{area}' area "
-                f"by reading the ha://areas resource, then filtering ha://entities and "
-                f"ha://devices to that area. Present a summary so the user can confirm "
-                f"which entities to use."
-            )
+            area_instruction = _WIZARD_AREA_WITH.format(area=area)
         else:
-            area_instruction = (
-                "\n2. If the description mentions a room or area, list the available "
-                "devices and entities there by reading ha://areas, ha://entities, and "
-                "ha://devices. Otherwise, identify the relevant entities from the "
-                "description and look them up via ha://states."
-            )
-
-        return (
-            f"Help me create a Home Assistant automation based on this description:\n"
-            f"\"{description}\"\n\n"
-            f"Follow these steps carefully:\n\n"
-            f"1. Parse the description above and identify the intended trigger(s), "
-            f"condition(s), and action(s). Summarize your understanding and ask for "
-            f"confirmation before proceeding."
-            f"{area_instruction}\n"
-            f"3. Build the complete automation configuration with proper trigger, "
-            f"condition, and action sections. Use the correct entity IDs discovered "
-            f"in the previous step. Choose appropriate trigger platforms (state, time, "
-            f"numeric_state, event, etc.) based on the description.\n"
-            f"4. Validate the automation configuration using the validate_automation_config "
-            f"tool to catch any errors before creating it.\n"
-            f"5. Create the automation using the create_automation tool. Present the "
-            f"dry-run result and ask for confirmation before finalizing.\n\n"
-            f"Important: At each step, explain what you are doing and why. If anything "
-            f"is ambiguous in the description, ask for clarification rather than guessing."
+            area_instruction = _WIZARD_AREA_WITHOUT
+        return _WIZARD_TEMPLATE.format(
+            description=description, area_instruction=area_instruction
         )
 
     @mcp_server.prompt()
     def optimize_automations() -> str:
         """Analyze all existing automations and suggest improvements, detect conflicts, and identify gaps."""
-        return (
-            "Perform a comprehensive review of all Home Assistant automations and "
-            "suggest improvements.\n\n"
-            "Follow these steps:\n\n"
-            "1. List all existing automations by reading the ha://automations resource. "
-            "For each automation, retrieve its full configuration using the "
-            "get_automation tool.\n"
-            "2. Run the detect_automation_conflicts tool to identify any automations "
-            "that may conflict with each other (overlapping triggers acting on the "
-            "same entities, contradictory actions, race conditions). Present any "
-            "conflicts found with explanations.\n"
-            "3. Analyze automation coverage using the analyze_automation_coverage tool. "
-            "Identify areas or devices that have no automations, entities that are "
-            "used in triggers but never in actions (or vice versa), and common "
-            "automation patterns that are missing.\n"
-            "4. For each automation, suggest specific improvements such as:\n"
-            "   - Adding conditions to prevent unnecessary runs\n"
-            "   - Consolidating duplicate or near-duplicate automations\n"
-            "   - Improving trigger specificity to reduce false activations\n"
-            "   - Adding error handling or fallback actions\n"
-            "   - Optimizing execution order\n\n"
-            "Present a prioritized summary of all findings with actionable "
-            "recommendations. For each suggestion, explain the benefit and offer "
-            "to implement it."
-        )
+        return _OPTIMIZE_PROMPT
 
     @mcp_server.prompt()
     def build_dashboard(area: str = "") -> str:
         """Guided workflow to design and build a Lovelace dashboard."""
-        area_filter = ""
         if area:
-            area_filter = (
-                f" Focus specifically on the '{area}' area. Filter entities "
-                f"and devices to only those assigned to this area."
+            return _DASHBOARD_TEMPLATE.format(
+                area_filter=_DASHBOARD_AREA_FILTER.format(area=area),
+                area_entities=_DASHBOARD_AREA_ENTITIES,
             )
-
-        return (
-            f"Help me design and build a Lovelace dashboard for Home Assistant."
-            f"{area_filter}\n\n"
-            f"Follow these steps:\n\n"
-            f"1. List the relevant entities by reading ha://entities and ha://states."
-            f"{' Filter to entities in the specified area.' if area else ''} "
-            f"Group them by domain (lights, sensors, climate, media_player, etc.) "
-            f"and present a summary of what is available.\n"
-            f"2. Based on the available entities, suggest a dashboard layout. Consider:\n"
-            f"   - A status overview section with key sensors and states\n"
-            f"   - Control cards for lights, switches, and climate devices\n"
-            f"   - Sensor history graphs for temperature, humidity, energy, etc.\n"
-            f"   - Media player controls if applicable\n"
-            f"   - Camera feeds if available\n"
-            f"   Present the proposed layout and ask for feedback before proceeding.\n"
-            f"3. Build the complete Lovelace dashboard YAML configuration using "
-            f"appropriate card types (entities, glance, history-graph, "
-            f"media-control, picture-entity, thermostat, etc.). Use proper views "
-            f"and organize cards logically.\n"
-            f"4. Save the dashboard using the create_dashboard tool. Present the "
-            f"dry-run result for review and ask for confirmation before finalizing.\n\n"
-            f"Aim for a clean, functional layout. Ask about preferences (dark theme, "
-            f"compact layout, specific card styles) before building."
-        )
+        return _DASHBOARD_TEMPLATE.format(area_filter="", area_entities="")
 
     @mcp_server.prompt()
     def setup_helper_and_automation(helper_type: str, purpose: str) -> str:
         """Create an input helper entity and an automation that uses it together."""
-        return (
-            f"Help me create a '{helper_type}' input helper for the following purpose: "
-            f"\"{purpose}\"\n\n"
-            f"Then create an automation that uses this helper.\n\n"
-            f"Follow these steps:\n\n"
-            f"1. Create the appropriate input helper using the create_helper tool. "
-            f"Based on the helper type '{helper_type}', configure it with:\n"
-            f"   - A descriptive name and entity ID derived from the purpose\n"
-            f"   - Appropriate options, min/max values, or defaults for the helper type\n"
-            f"   - An icon that matches the purpose\n"
-            f"   Present the helper configuration for review before creating it.\n"
-            f"2. Create an automation that uses this helper as a trigger, condition, "
-            f"or part of its action logic. The automation should:\n"
-            f"   - Trigger when the helper value changes (or at a time set by the "
-            f"helper, if it is a datetime/time helper)\n"
-            f"   - Perform actions that align with the stated purpose\n"
-            f"   - Use the helper's value in templates where appropriate\n"
-            f"   Present the automation configuration for review before creating it.\n"
-            f"3. Verify both the helper and automation were created successfully by:\n"
-            f"   - Checking the helper state via ha://states\n"
-            f"   - Retrieving the automation config with get_automation\n"
-            f"   - Confirming the automation references the helper entity correctly\n\n"
-            f"Explain at each step how the helper and automation work together."
+        return _HELPER_AUTOMATION_TEMPLATE.format(
+            helper_type=helper_type, purpose=purpose
         )
 
     @mcp_server.prompt()
     def import_and_configure_blueprint(url: str = "") -> str:
         """Import a community blueprint and configure it into a working automation or script."""
         if url:
-            import_step = (
-                f"1. Import the blueprint from the provided URL:\n"
-                f"   {url}\n"
-                f"   Use the import_blueprint tool to fetch and install it. "
-                f"Report whether the import succeeded and show the blueprint metadata."
-            )
+            import_step = _BLUEPRINT_IMPORT_URL.format(url=url)
         else:
-            import_step = (
-                "1. List existing blueprints by reading the ha://blueprints/automation "
-                "and ha://blueprints/script resources. Present them in a clear list "
-                "with their names, descriptions, and domains. Ask the user which "
-                "blueprint they want to configure, or if they want to import a new "
-                "one by URL."
-            )
-
-        return (
-            f"Help me import and configure a Home Assistant blueprint.\n\n"
-            f"Follow these steps:\n\n"
-            f"{import_step}\n"
-            f"2. Retrieve and display the blueprint's input schema. For each input, "
-            f"show:\n"
-            f"   - The input name and description\n"
-            f"   - Whether it is required or optional\n"
-            f"   - The expected type (entity, device, area, number, text, etc.)\n"
-            f"   - Any default values or selectors\n"
-            f"3. Help the user configure each input by:\n"
-            f"   - Suggesting appropriate entities/devices from ha://entities and "
-            f"ha://devices that match the input's selector type\n"
-            f"   - Explaining what each input does in plain language\n"
-            f"   - Validating that chosen values are compatible\n"
-            f"4. Create the automation or script from the blueprint using the "
-            f"appropriate creation tool with the configured inputs. Present the "
-            f"dry-run result and ask for confirmation.\n\n"
-            f"Make sure to explain what the blueprint does overall before diving "
-            f"into configuration details."
-        )
+            import_step = _BLUEPRINT_IMPORT_LIST
+        return _BLUEPRINT_TEMPLATE.format(import_step=import_step)
 
     @mcp_server.prompt()
     def troubleshoot_automation(automation_id: str) -> str:
         """Debug and troubleshoot a broken or misbehaving automation."""
-        return (
-            f"Help me troubleshoot the automation '{automation_id}'.\n\n"
-            f"Follow these diagnostic steps:\n\n"
-            f"1. Retrieve the full automation configuration using the get_automation "
-            f"tool with entity_id '{automation_id}'. Display the trigger(s), "
-            f"condition(s), and action(s) in a readable format.\n"
-            f"2. Validate the automation configuration using validate_automation_config "
-            f"to check for structural errors, missing required fields, or invalid "
-            f"values. Report any validation errors found.\n"
-            f"3. Check the current state of all entities referenced in the automation's "
-            f"triggers and conditions. For each entity:\n"
-            f"   - Show its current state and attributes\n"
-            f"   - Verify the entity exists and is available\n"
-            f"   - Check if the trigger conditions could currently be met\n"
-            f"4. Check the logbook for recent executions of this automation using the "
-            f"get_logbook tool. Look for:\n"
-            f"   - When it last ran (or if it has never run)\n"
-            f"   - Whether runs completed successfully or failed\n"
-            f"   - The frequency of runs (too often may indicate a trigger issue)\n"
-            f"5. Check the Home Assistant error log using the get_error_log tool for "
-            f"any errors or warnings related to this automation or its referenced "
-            f"entities. Filter for relevant entries.\n"
-            f"6. Based on all findings, provide a diagnosis:\n"
-            f"   - Identify the most likely cause of the problem\n"
-            f"   - Suggest specific fixes with updated configuration if needed\n"
-            f"   - Offer to apply the fixes using the update_automation tool\n\n"
-            f"Be thorough and check each step even if an earlier step reveals an "
-            f"obvious issue -- there may be multiple problems."
-        )
+        return _TROUBLESHOOT_TEMPLATE.format(automation_id=automation_id)
@@ -6,9 +6,8 @@ Only resource templates (with URI parameters) are registered here, since FastMCP
 static resources don't support accessing lifespan context.
 """
 
-import json
-
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 
 
 def register_resources(mcp_server):
@@ -24,7 +23,7 @@ def register_resources(mcp_server):
         # resource templates pass URI params as function args.
         # Blueprint listing is handled via the list_blueprints tool
         # for full functionality with client access.
-        return json.dumps({
+        return json_util.dumps({
             "info": f"Use the list_blueprints tool with domain='{domain}' for full blueprint data.",
             "domain": domain,
         })
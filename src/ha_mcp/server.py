@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastmcp import FastMCP
@@ -14,18 +15,30 @@ async def lifespan(server: FastMCP):
     """Create HA clients at startup, share via lifespan context, cleanup on shutdown."""
     ws_client = HAWebSocketClient(settings.ha_websocket_url, settings.ha_token)
     rest_client = HARestClient(settings.ha_base_url, settings.ha_token)
+    rest_client.use_state_cache(ws_client)
 
     logger.info("Connecting to Home Assistant at %s", settings.ha_base_url)
-    await ws_client.connect()
-    await rest_client.connect()
+    results = await asyncio.gather(
+        ws_client.connect(), rest_client.connect(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            # Don't leak whichever client did connect.
+            await asyncio.gather(
+                ws_client.disconnect(), rest_client.disconnect(),
+                return_exceptions=True,
+            )
+            raise result
     logger.info("Connected to Home Assistant successfully")
 
     try:
         yield {"ws": ws_client, "rest": rest_client}
     finally:
         logger.info("Disconnecting from Home Assistant")
-        await ws_client.disconnect()
-        await rest_client.disconnect()
+        await asyncio.gather(
+            ws_client.disconnect(), rest_client.disconnect(),
+            return_exceptions=True,
+        )
 
 
 mcp = FastMCP(
@@ -1,26 +1,29 @@
 """MCP Tools for Home Assistant configuration management."""
 
-from ha_mcp.tools.registry import register_registry_tools
-from ha_mcp.tools.state import register_state_tools
-from ha_mcp.tools.automation import register_automation_tools
-from ha_mcp.tools.script import register_script_tools
-from ha_mcp.tools.scene import register_scene_tools
-from ha_mcp.tools.helper import register_helper_tools
-from ha_mcp.tools.dashboard import register_dashboard_tools
-from ha_mcp.tools.blueprint import register_blueprint_tools
-from ha_mcp.tools.config_validation import register_config_validation_tools
-from ha_mcp.tools.suggestions import register_suggestion_tools
+import importlib
+
+# Tool modules in registration order. Each ``ha_mcp.tools.<name>`` module
+# is listed with the name of its registrar function.
+_TOOL_MODULES = (
+    ("registry", "register_registry_tools"),
+    ("state", "register_state_tools"),
+    ("automation", "register_automation_tools"),
+    ("script", "register_script_tools"),
+    ("scene", "register_scene_tools"),
+    ("helper", "register_helper_tools"),
+    ("dashboard", "register_dashboard_tools"),
+    ("blueprint", "register_blueprint_tools"),
+    ("config_validation", "register_config_validation_tools"),
+    ("suggestions", "register_suggestion_tools"),
+)
 
 
 def register_all_tools(mcp):
-    """Register all tool modules with the MCP server."""
-    register_registry_tools(mcp)
-    register_state_tools(mcp)
-    register_automation_tools(mcp)
-    register_script_tools(mcp)
-    register_scene_tools(mcp)
-    register_helper_tools(mcp)
-    register_dashboard_tools(mcp)
-    register_blueprint_tools(mcp)
-    register_config_validation_tools(mcp)
-    register_suggestion_tools(mcp)
+    """Register all tool modules with the MCP server.
+
+    Tool modules are imported here rather than at package import, so
+    importing ``ha_mcp.tools`` (e.g. for a single registrar) stays cheap.
+    """
+    for module_name, registrar in _TOOL_MODULES:
+        module = importlib.import_module(f"ha_mcp.tools.{module_name}")
+        getattr(module, registrar)(mcp)
@@ -1,23 +1,150 @@
 """Automation CRUD tools for Home Assistant."""
 
-import json
+import asyncio
+import hashlib
 import logging
-import uuid
+import time
+from collections import OrderedDict
 
+import orjson
 from fastmcp import Context
 
+from ha_mcp.ha_client.models import HAConnectionError
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 from ha_mcp.util.yaml_util import to_yaml, diff_configs
 
 logger = logging.getLogger(__name__)
 
+# Concurrent config fetches issued by get_all_automation_configs.
+_CONFIG_FETCH_CONCURRENCY = 16
+
+# Recent passing validate_config results, keyed by a hash of the validated
+# sections. The outcome depends on live HA state (referenced entities,
+# devices, integrations), so entries expire quickly and failures are never
+# cached: a config fixed by adding the missing entity revalidates at once.
+_VALIDATE_CACHE_TTL = 30.0
+_VALIDATE_CACHE_MAX = 128
+_validate_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+
+def _all_valid(result: dict) -> bool:
+    return all(
+        isinstance(section, dict) and section.get("valid") is True
+        for section in result.values()
+    )
+
+
+def _copy_result(result: dict) -> dict:
+    return {
+        key: dict(section) if isinstance(section, dict) else section
+        for key, section in result.items()
+    }
+
+
+async def _validate_config(ws, **sections) -> dict:
+    """Run HA's validate_config, reusing a recent passing result.
+
+    Returns a fresh copy each call, so callers may modify it.
+    """
+    key = hashlib.blake2b(
+        orjson.dumps(sections, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).digest()
+    entry = _validate_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            _validate_cache.move_to_end(key)
+            return _copy_result(entry[1])
+        del _validate_cache[key]
+
+    result = await ws.send_command("validate_config", **sections)
+    if isinstance(result, dict) and result and _all_valid(result):
+        _validate_cache[key] = (
+            time.monotonic() + _VALIDATE_CACHE_TTL, _copy_result(result)
+        )
+        if len(_validate_cache) > _VALIDATE_CACHE_MAX:
+            _validate_cache.popitem(last=False)
+    return result
+
+
+# Automation section keys. HA 2024.10 renamed them to the plural forms but
+# still accepts the singular ones, and older releases only know those.
+_SINGULAR_KEYS = ("trigger", "condition", "action")
+_PLURAL_KEYS = ("triggers", "conditions", "actions")
+
+
+def _section_keys(ws) -> tuple[str, str, str]:
+    """Return the trigger/condition/action keys the connected HA expects."""
+    try:
+        year, month = (int(part) for part in ws.ha_version.split(".")[:2])
+    except (AttributeError, ValueError):
+        # Unknown version: assume a current release.
+        return _PLURAL_KEYS
+    return _PLURAL_KEYS if (year, month) >= (2024, 10) else _SINGULAR_KEYS
+
+
+def _normalize_keys(config: dict, keys: tuple[str, str, str]) -> dict:
+    """Return *config* with its trigger/condition/action sections named *keys*.
+
+    Key order is preserved. The input is returned as-is when nothing needs
+    renaming.
+    """
+    renames = {}
+    for singular, plural, key in zip(_SINGULAR_KEYS, _PLURAL_KEYS, keys):
+        other = plural if key == singular else singular
+        if other in config and key not in config:
+            renames[other] = key
+    if not renames:
+        return config
+    return {renames.get(k, k): v for k, v in config.items()}
+
+
+async def _validate(ws, config: dict) -> dict:
+    """Validate an automation config, degrading to a warning if HA can't.
+
+    Validation is advisory: when the command fails the result is marked
+    valid with a warning, so the change can still be confirmed.
+    """
+    trigger_key, condition_key, action_key = _section_keys(ws)
+    try:
+        return await _validate_config(
+            ws,
+            trigger=config.get(trigger_key, []),
+            condition=config.get(condition_key, []),
+            action=config.get(action_key, []),
+        )
+    except Exception as e:
+        logger.warning("Config validation unavailable: %s", e)
+        return {"valid": True, "warnings": [f"Validation skipped: {e}"]}
+
+
+_RELOAD = {"domain": "automation", "service": "reload"}
+
+
+async def _reload_automations(ws, automation_id: str | None = None) -> None:
+    """Reload a single automation, or all of them when no ID is given.
+
+    Reloading by ID only re-parses the changed automation. HA versions that
+    don't accept an ``id`` reject the call, and we fall back to a full reload.
+    """
+    if automation_id is not None:
+        try:
+            await ws.send_command(
+                "call_service", **_RELOAD, service_data={"id": automation_id}
+            )
+            return
+        except HAConnectionError as e:
+            logger.debug("Per-automation reload unavailable, reloading all: %s", e)
+
+    await ws.send_command("call_service", **_RELOAD)
+
 
 def register_automation_tools(mcp_server):
     """Register all automation management tools on the MCP server."""
 
     @mcp_server.tool()
-    async def list_automations(ctx: Context) -> str:
+    async def list_automations(ctx: Context, pretty: bool = False) -> str:
         """List all automations in Home Assistant.
 
         Returns a JSON array of automation summaries, each containing:
@@ -27,44 +154,114 @@ def register_automation_tools(mcp_server):
         - last_triggered: Timestamp of the last time this automation fired
 
         Use this to discover existing automations before creating or modifying them.
+        Set pretty to True for indented output.
         """
         _ws, rest = get_clients(ctx)
-        states = await rest.get_states()
-
-        automations = []
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            if not entity_id.startswith("automation."):
-                continue
-            attrs = state.get("attributes", {})
-            automations.append({
-                "id": entity_id,
-                "alias": attrs.get("friendly_name", ""),
+        states = await rest.get_states_by_domain("automation")
+
+        automations = [
+            {
+                "id": state["entity_id"],
+                "alias": (attrs := state.get("attributes") or {}).get(
+                    "friendly_name", ""
+                ),
                 "state": state.get("state", "unknown"),
                 "last_triggered": attrs.get("last_triggered"),
-            })
+            }
+            for state in states
+        ]
 
-        return json.dumps(automations, indent=2)
+        return json_util.dumps(automations, pretty=pretty)
 
     @mcp_server.tool()
-    async def get_automation(ctx: Context, automation_id: str) -> str:
+    async def get_automation(
+        ctx: Context, automation_id: str, pretty: bool = False
+    ) -> str:
         """Get the full configuration of a single automation.
 
         Parameters:
             automation_id: The automation's internal ID (not the entity_id).
                 This is the ID used in the HA config store, typically a UUID
                 or slug found in the automation entity's attributes.
+            pretty: If True, indent the returned JSON for readability.
 
         Returns the complete automation configuration as JSON, including
         alias, description, triggers, conditions, actions, and mode.
         """
         _ws, rest = get_clients(ctx)
         config = await rest.get_automation_config(automation_id)
-        return json.dumps(config, indent=2)
+        return json_util.dumps(config, pretty=pretty)
+
+    @mcp_server.tool()
+    async def get_all_automation_configs(
+        ctx: Context, limit: int = 50, offset: int = 0, pretty: bool = False
+    ) -> str:
+        """Get the full configurations of many automations in one call.
+
+        Parameters:
+            limit: Maximum number of automations to return (default 50).
+            offset: Number of automations to skip, for paging with limit.
+            pretty: If True, indent the returned JSON for readability.
+
+        Returns a JSON object with:
+            - configs: Each automation's internal ID mapped to its complete
+              configuration
+            - total: Number of automations with an internal ID
+            - truncated: True if more automations follow; request them with
+              offset set to offset + limit
+            - failed: IDs whose config could not be retrieved
+
+        Configs are fetched concurrently, so prefer this over calling
+        get_automation once per automation when reviewing many of them.
+        Automations defined in YAML rather than the UI config store have no
+        internal ID and are not included.
+        """
+        _ws, rest = get_clients(ctx)
+        states = await rest.get_states_by_domain("automation")
+        all_ids = [
+            auto_id
+            for state in states
+            if (auto_id := (state.get("attributes") or {}).get("id"))
+        ]
+        offset = max(offset, 0)
+        ids = all_ids[offset:offset + max(limit, 0)]
+
+        semaphore = asyncio.Semaphore(_CONFIG_FETCH_CONCURRENCY)
+
+        async def fetch(auto_id: str) -> dict:
+            async with semaphore:
+                return await rest.get_automation_config(auto_id)
+
+        results = await asyncio.gather(
+            *(fetch(auto_id) for auto_id in ids), return_exceptions=True
+        )
+
+        configs = {}
+        failed = []
+        for auto_id, result in zip(ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Could not retrieve automation %s: %s", auto_id, result)
+                failed.append(auto_id)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                configs[auto_id] = result
+        return json_util.dumps(
+            {
+                "configs": configs,
+                "total": len(all_ids),
+                "truncated": offset + len(ids) < len(all_ids),
+                "failed": failed,
+            },
+            pretty=pretty,
+        )
 
     @mcp_server.tool()
     async def create_automation(
-        ctx: Context, config: str, skip_confirm: bool = False
+        ctx: Context,
+        config: str,
+        skip_confirm: bool = False,
+        reload_deferred: bool = False,
     ) -> str:
         """Create a new automation in Home Assistant.
 
@@ -76,10 +273,12 @@ def register_automation_tools(mcp_server):
                 generated if not provided.
             skip_confirm: If True, skip the dry-run confirmation prompt and
                 apply the change immediately.
+            reload_deferred: If True, save without reloading automations.
+                Call reload_automations once after a batch of changes.
 
-        The automation config is validated against the Home Assistant config
-        validator before applying. A YAML preview is shown for confirmation
-        unless skip_confirm is True.
+        Unless skip_confirm is True, the automation config is validated
+        against the Home Assistant config validator and a YAML preview is
+        shown for confirmation.
 
         Returns a success message with the new automation ID, or a
         cancellation/error message.
@@ -87,26 +286,25 @@ def register_automation_tools(mcp_server):
         ws, rest = get_clients(ctx)
 
         try:
-            auto_config = json.loads(config)
-        except json.JSONDecodeError as e:
+            auto_config = json_util.loads(config)
+        except json_util.JSONDecodeError as e:
             return f"Error: Invalid JSON in config: {e}"
 
         # Generate an ID if not provided
-        auto_id = auto_config.pop("id", None) or str(uuid.uuid4())
+        auto_config = _normalize_keys(auto_config, _section_keys(ws))
+        auto_id = auto_config.pop("id", None)
+        if not auto_id:
+            from uuid import uuid4
+
+            auto_id = uuid4().hex
         alias = auto_config.get("alias", auto_id)
 
-        # Validate the automation config via WebSocket
+        # Validate the automation config via WebSocket. The result only
+        # feeds the confirmation preview, so skip it when there is none;
+        # otherwise confirm_change awaits it while rendering the preview.
         validation_result = None
-        try:
-            validation_result = await ws.send_command(
-                "validate_config",
-                trigger=auto_config.get("triggers", auto_config.get("trigger", [])),
-                condition=auto_config.get("conditions", auto_config.get("condition", [])),
-                action=auto_config.get("actions", auto_config.get("action", [])),
-            )
-        except Exception as e:
-            logger.warning("Config validation unavailable: %s", e)
-            validation_result = {"valid": True, "warnings": [f"Validation skipped: {e}"]}
+        if not skip_confirm:
+            validation_result = _validate(ws, auto_config)
 
         # Dry-run confirmation
         confirmed = await confirm_change(
@@ -120,15 +318,18 @@ def register_automation_tools(mcp_server):
         await rest.save_automation_config(auto_id, auto_config)
 
         # Reload automations so HA picks up the new config
-        await ws.send_command(
-            "call_service", domain="automation", service="reload",
-        )
+        if not reload_deferred:
+            await _reload_automations(ws, auto_id)
 
         return f"Automation created successfully. ID: {auto_id}, Alias: {alias}"
 
     @mcp_server.tool()
     async def update_automation(
-        ctx: Context, automation_id: str, config: str, skip_confirm: bool = False
+        ctx: Context,
+        automation_id: str,
+        config: str,
+        skip_confirm: bool = False,
+        reload_deferred: bool = False,
     ) -> str:
         """Update an existing automation's configuration.
 
@@ -138,6 +339,8 @@ def register_automation_tools(mcp_server):
                 This replaces the entire configuration; include all desired
                 fields (alias, triggers, conditions, actions, mode, etc.).
             skip_confirm: If True, skip the dry-run confirmation prompt.
+            reload_deferred: If True, save without reloading automations.
+                Call reload_automations once after a batch of changes.
 
         Shows a diff between the current and proposed configuration for
         review. The new config is validated before applying.
@@ -146,40 +349,42 @@ def register_automation_tools(mcp_server):
         """
         ws, rest = get_clients(ctx)
 
-        # Fetch existing config
         try:
-            old_config = await rest.get_automation_config(automation_id)
-        except Exception as e:
-            return f"Error: Could not retrieve automation {automation_id}: {e}"
-
-        try:
-            new_config = json.loads(config)
-        except json.JSONDecodeError as e:
+            new_config = json_util.loads(config)
+        except json_util.JSONDecodeError as e:
             return f"Error: Invalid JSON in config: {e}"
 
         # Remove 'id' from new config if present (it's the URL path param)
         new_config.pop("id", None)
+        keys = _section_keys(ws)
+        new_config = _normalize_keys(new_config, keys)
+
+        # The validation only needs the proposed config, so it runs
+        # alongside the fetch of the existing one. It only feeds the
+        # confirmation preview, so it is skipped when there is none.
+        pending = [rest.get_automation_config(automation_id)]
+        if not skip_confirm:
+            pending.append(_validate(ws, new_config))
+        old_config, *validation = await asyncio.gather(
+            *pending, return_exceptions=True
+        )
+        validation_result = validation[0] if validation else None
+        if isinstance(old_config, Exception):
+            return f"Error: Could not retrieve automation {automation_id}: {old_config}"
+        if isinstance(old_config, BaseException):
+            raise old_config
+
         alias = new_config.get("alias", old_config.get("alias", automation_id))
 
-        # Validate the new config via WebSocket
-        validation_result = None
-        try:
-            validation_result = await ws.send_command(
-                "validate_config",
-                trigger=new_config.get("triggers", new_config.get("trigger", [])),
-                condition=new_config.get("conditions", new_config.get("condition", [])),
-                action=new_config.get("actions", new_config.get("action", [])),
+        # Build a confirmation message that includes the diff. The diff is
+        # only rendered when the preview is actually going to be shown.
+        confirm_config = {"proposed": new_config}
+        if not skip_confirm:
+            # Stored configs may use the other key spelling; align them so
+            # the diff doesn't show a spurious rename.
+            confirm_config["diff"] = diff_configs(
+                _normalize_keys(old_config, keys), new_config
             )
-        except Exception as e:
-            logger.warning("Config validation unavailable: %s", e)
-            validation_result = {"valid": True, "warnings": [f"Validation skipped: {e}"]}
-
-        # Build a confirmation message that includes the diff
-        diff_text = diff_configs(old_config, new_config)
-        confirm_config = {
-            "proposed": new_config,
-            "diff": diff_text,
-        }
 
         confirmed = await confirm_change(
             ctx, "UPDATE", "automation", alias, confirm_config,
@@ -191,22 +396,26 @@ def register_automation_tools(mcp_server):
         # Save the updated config
         await rest.save_automation_config(automation_id, new_config)
 
-        # Reload automations
-        await ws.send_command(
-            "call_service", domain="automation", service="reload",
-        )
+        # Reload the updated automation
+        if not reload_deferred:
+            await _reload_automations(ws, automation_id)
 
         return f"Automation '{alias}' (ID: {automation_id}) updated successfully."
 
     @mcp_server.tool()
     async def delete_automation(
-        ctx: Context, automation_id: str, skip_confirm: bool = False
+        ctx: Context,
+        automation_id: str,
+        skip_confirm: bool = False,
+        reload_deferred: bool = False,
     ) -> str:
         """Delete an automation from Home Assistant.
 
         Parameters:
             automation_id: The automation's internal ID (config store ID).
             skip_confirm: If True, skip the dry-run confirmation prompt.
+            reload_deferred: If True, delete without reloading automations.
+                Call reload_automations once after a batch of changes.
 
         Shows the current automation configuration for review before
         deletion. This action is irreversible.
@@ -232,12 +441,22 @@ def register_automation_tools(mcp_server):
         await rest.delete_automation_config(automation_id)
 
         # Reload automations
-        await ws.send_command(
-            "call_service", domain="automation", service="reload",
-        )
+        if not reload_deferred:
+            await _reload_automations(ws)
 
         return f"Automation '{automation_id}' deleted successfully."
 
+    @mcp_server.tool()
+    async def reload_automations(ctx: Context) -> str:
+        """Reload all automations so Home Assistant picks up saved changes.
+
+        Use this once after a batch of create/update/delete/duplicate calls
+        made with reload_deferred=True.
+        """
+        ws, _rest = get_clients(ctx)
+        await _reload_automations(ws)
+        return "Automations reloaded successfully."
+
     @mcp_server.tool()
     async def toggle_automation(ctx: Context, entity_id: str, enabled: bool) -> str:
         """Enable or disable an automation.
@@ -253,15 +472,29 @@ def register_automation_tools(mcp_server):
 
         Returns a status message confirming the change.
         """
-        _ws, rest = get_clients(ctx)
+        ws, rest = get_clients(ctx)
         service = "turn_on" if enabled else "turn_off"
-        await rest.call_service("automation", service, {"entity_id": entity_id})
+        service_data = {"entity_id": entity_id}
+        # The open WebSocket avoids an HTTP round trip; REST covers the
+        # window while it is reconnecting.
+        if ws is not None and ws.connected:
+            await ws.send_command(
+                "call_service",
+                domain="automation",
+                service=service,
+                service_data=service_data,
+            )
+        else:
+            await rest.call_service("automation", service, service_data)
         state_label = "enabled" if enabled else "disabled"
         return f"Automation '{entity_id}' {state_label} successfully."
 
     @mcp_server.tool()
     async def duplicate_automation(
-        ctx: Context, automation_id: str, new_alias: str | None = None
+        ctx: Context,
+        automation_id: str,
+        new_alias: str | None = None,
+        reload_deferred: bool = False,
     ) -> str:
         """Duplicate an existing automation with a new ID.
 
@@ -269,6 +502,8 @@ def register_automation_tools(mcp_server):
             automation_id: The internal ID of the automation to copy.
             new_alias: Optional alias for the new automation. If not
                 provided, ' (Copy)' is appended to the original alias.
+            reload_deferred: If True, save without reloading automations.
+                Call reload_automations once after a batch of changes.
 
         Creates a copy of the source automation's configuration with a
         new UUID. The new automation is saved and automations are reloaded.
@@ -286,7 +521,9 @@ def register_automation_tools(mcp_server):
             return f"Error: Could not retrieve automation {automation_id}: {e}"
 
         # Generate new ID
-        new_id = str(uuid.uuid4())
+        from uuid import uuid4
+
+        new_id = uuid4().hex
 
         # Set alias
         if new_alias:
@@ -301,10 +538,9 @@ def register_automation_tools(mcp_server):
         # Save as new automation
         await rest.save_automation_config(new_id, source_config)
 
-        # Reload automations
-        await ws.send_command(
-            "call_service", domain="automation", service="reload",
-        )
+        # Load the new automation
+        if not reload_deferred:
+            await _reload_automations(ws, new_id)
 
         return (
             f"Automation duplicated successfully. "
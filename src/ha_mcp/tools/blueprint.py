@@ -1,17 +1,68 @@
 """Blueprint management tools for Home Assistant."""
 
-import json
 import logging
-import uuid
+import re
+import secrets
+import time
 
 from fastmcp import Context
 
+from ha_mcp.ha_client.models import HAError
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 
 logger = logging.getLogger(__name__)
 
 
+def _error(message: str) -> str:
+    return json_util.dumps({"success": False, "error": message})
+
+
+def _invalid_domain(domain: str) -> str:
+    return _error(f"Invalid domain '{domain}'. Must be 'automation' or 'script'.")
+
+
+# Fixed error replies are serialized once at import.
+_IMPORT_CANCELLED = _error("Blueprint import cancelled by user.")
+_INPUTS_NOT_OBJECT = _error("Inputs must be a JSON object.")
+_CREATE_CANCELLED = {
+    domain: _error(f"{domain.capitalize()} creation from blueprint cancelled by user.")
+    for domain in ("automation", "script")
+}
+
+_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+
+# Blueprint inventories rarely change, so serialized list/get responses are
+# kept briefly. Keys are ("list", domain) and ("get", domain, path); a None
+# domain means both. Importing a blueprint drops the entries for its domain.
+_CACHE_TTL = 30.0
+_CACHE_MAX_ENTRIES = 128
+_cache: dict[tuple, tuple[float, str]] = {}
+
+
+def _cache_get(key: tuple) -> str | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _cache[key]
+        return None
+    return entry[1]
+
+
+def _cache_put(key: tuple, value: str) -> str:
+    if len(_cache) >= _CACHE_MAX_ENTRIES:
+        _cache.clear()
+    _cache[key] = (time.monotonic() + _CACHE_TTL, value)
+    return value
+
+
+def _invalidate_domain(domain: str) -> None:
+    for key in [k for k in _cache if k[1] in (domain, None)]:
+        del _cache[key]
+
+
 def register_blueprint_tools(mcp_server):
     """Register all blueprint management tools on the MCP server."""
 
@@ -33,24 +84,43 @@ def register_blueprint_tools(mcp_server):
 
         if domain is not None:
             if domain not in ("automation", "script"):
-                return json.dumps({
-                    "success": False,
-                    "error": f"Invalid domain '{domain}'. Must be 'automation' or 'script'.",
-                })
+                return _invalid_domain(domain)
+            cached = _cache_get(("list", domain))
+            if cached is not None:
+                return cached
             result = await ws.send_command("blueprint/list", domain=domain)
-            return json.dumps({"domain": domain, "blueprints": result}, indent=2)
+            return _cache_put(
+                ("list", domain),
+                json_util.dumps({"domain": domain, "blueprints": result}),
+            )
 
-        # Query both domains and merge results
+        cached = _cache_get(("list", None))
+        if cached is not None:
+            return cached
+
+        # Query both domains in one pipelined batch and merge results
+        domains = ("automation", "script")
+        try:
+            results = await ws.send_commands(
+                [{"type": "blueprint/list", "domain": d} for d in domains],
+                return_exceptions=True,
+            )
+        except (HAError, TimeoutError) as e:
+            results = [e] * len(domains)
         blueprints = {}
-        for d in ("automation", "script"):
-            try:
-                result = await ws.send_command("blueprint/list", domain=d)
+        failed = False
+        for d, result in zip(domains, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to list blueprints for domain '%s': %s", d, result)
+                blueprints[d] = {"error": str(result)}
+                failed = True
+            else:
                 blueprints[d] = result
-            except Exception as e:
-                logger.warning("Failed to list blueprints for domain '%s': %s", d, e)
-                blueprints[d] = {"error": str(e)}
 
-        return json.dumps(blueprints, indent=2)
+        output = json_util.dumps(blueprints)
+        if failed:
+            return output
+        return _cache_put(("list", None), output)
 
     @mcp_server.tool()
     async def get_blueprint(ctx: Context, domain: str, path: str) -> str:
@@ -68,13 +138,13 @@ def register_blueprint_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         if domain not in ("automation", "script"):
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid domain '{domain}'. Must be 'automation' or 'script'.",
-            })
+            return _invalid_domain(domain)
 
+        cached = _cache_get(("get", domain, path))
+        if cached is not None:
+            return cached
         result = await ws.send_command("blueprint/get", domain=domain, path=path)
-        return json.dumps(result, indent=2)
+        return _cache_put(("get", domain, path), json_util.dumps(result))
 
     @mcp_server.tool()
     async def import_blueprint(
@@ -99,32 +169,25 @@ def register_blueprint_tools(mcp_server):
         # First, import the blueprint to retrieve its configuration
         try:
             result = await ws.send_command("blueprint/import", url=url)
-        except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Failed to import blueprint from URL: {e}",
-            })
+        except (HAError, TimeoutError) as e:
+            return _error(f"Failed to import blueprint from URL: {e}")
 
         # The import command returns the blueprint config for confirmation
         suggested_filename = result.get("suggested_filename", "unknown.yaml")
-        blueprint_config = result.get("raw_data", result)
+        raw_data = result.get("raw_data", "")
         blueprint_domain = result.get("blueprint", {}).get("domain", "automation")
 
-        # Confirm the import with the user
-        confirmed = await confirm_change(
-            ctx,
-            action="IMPORT",
-            entity_type="blueprint",
-            identifier=f"{blueprint_domain}/{suggested_filename}",
-            config=blueprint_config if isinstance(blueprint_config, dict) else {"raw_data": blueprint_config},
-            skip_confirm=skip_confirm,
-        )
-
-        if not confirmed:
-            return json.dumps({
-                "success": False,
-                "error": "Blueprint import cancelled by user.",
-            })
+        # Confirm the import with the user; skip_confirm needs no preview
+        if not skip_confirm:
+            confirmed = await confirm_change(
+                ctx,
+                action="IMPORT",
+                entity_type="blueprint",
+                identifier=f"{blueprint_domain}/{suggested_filename}",
+                config=raw_data if isinstance(raw_data, dict) else {"raw_data": raw_data},
+            )
+            if not confirmed:
+                return _IMPORT_CANCELLED
 
         # Save the imported blueprint
         try:
@@ -132,16 +195,15 @@ def register_blueprint_tools(mcp_server):
                 "blueprint/save",
                 domain=blueprint_domain,
                 path=suggested_filename,
-                yaml=result.get("raw_data", ""),
+                yaml=raw_data,
                 source_url=url,
             )
-        except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Failed to save imported blueprint: {e}",
-            })
+        except (HAError, TimeoutError) as e:
+            return _error(f"Failed to save imported blueprint: {e}")
+
+        _invalidate_domain(blueprint_domain)
 
-        return json.dumps({
+        return json_util.dumps({
             "success": True,
             "domain": blueprint_domain,
             "path": suggested_filename,
@@ -149,7 +211,7 @@ def register_blueprint_tools(mcp_server):
                 f"Blueprint imported successfully as "
                 f"'{blueprint_domain}/{suggested_filename}'."
             ),
-        }, indent=2)
+        })
 
     @mcp_server.tool()
     async def create_from_blueprint(
@@ -179,25 +241,16 @@ def register_blueprint_tools(mcp_server):
         ws, rest = get_clients(ctx)
 
         if domain not in ("automation", "script"):
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid domain '{domain}'. Must be 'automation' or 'script'.",
-            })
+            return _invalid_domain(domain)
 
         # Parse the inputs JSON
         try:
-            inputs_dict = json.loads(inputs)
-        except json.JSONDecodeError as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid JSON in inputs: {e}",
-            })
+            inputs_dict = json_util.loads(inputs)
+        except json_util.JSONDecodeError as e:
+            return _error(f"Invalid JSON in inputs: {e}")
 
         if not isinstance(inputs_dict, dict):
-            return json.dumps({
-                "success": False,
-                "error": "Inputs must be a JSON object.",
-            })
+            return _INPUTS_NOT_OBJECT
 
         # Extract optional top-level config fields from inputs
         alias = inputs_dict.pop("alias", None)
@@ -217,54 +270,42 @@ def register_blueprint_tools(mcp_server):
             config["description"] = description
 
         # Generate an ID for the new entity
-        entity_id_slug = alias.lower().replace(" ", "_").replace("-", "_") if alias else str(uuid.uuid4())
-        # Clean the slug to only valid characters
-        entity_id_slug = "".join(
-            c for c in entity_id_slug if c.isalnum() or c == "_"
-        )
-        if not entity_id_slug or not entity_id_slug[0].isalpha():
-            entity_id_slug = f"bp_{entity_id_slug}" if entity_id_slug else str(uuid.uuid4())
-
-        identifier = alias or f"{domain}/{blueprint_path}"
-
-        # Confirm the change with the user
-        confirmed = await confirm_change(
-            ctx,
-            action="CREATE",
-            entity_type=f"{domain} (from blueprint)",
-            identifier=identifier,
-            config=config,
-            skip_confirm=skip_confirm,
-        )
-
-        if not confirmed:
-            return json.dumps({
-                "success": False,
-                "error": f"{domain.capitalize()} creation from blueprint cancelled by user.",
-            })
-
-        # Save via the appropriate REST endpoint and reload
+        # Collapse anything outside [a-z0-9_] (spaces, dashes, punctuation)
+        # into underscores
+        entity_id_slug = _SLUG_RE.sub("_", alias.lower()).strip("_") if alias else ""
+        if not entity_id_slug:
+            entity_id_slug = f"bp_{secrets.token_hex(8)}"
+        elif not entity_id_slug[0].isalpha():
+            entity_id_slug = f"bp_{entity_id_slug}"
+
+        # Confirm the change with the user; skip_confirm needs no preview
+        if not skip_confirm:
+            confirmed = await confirm_change(
+                ctx,
+                action="CREATE",
+                entity_type=f"{domain} (from blueprint)",
+                identifier=alias or f"{domain}/{blueprint_path}",
+                config=config,
+            )
+            if not confirmed:
+                return _CREATE_CANCELLED[domain]
+
+        # Save via the appropriate REST endpoint, then reload. The reload
+        # must see the saved file, so the two calls stay ordered.
+        if domain == "automation":
+            save_config = rest.save_automation_config
+        else:
+            save_config = rest.save_script_config
         try:
-            if domain == "automation":
-                await rest.save_automation_config(entity_id_slug, config)
-                await ws.send_command(
-                    "call_service", domain="automation", service="reload",
-                )
-            else:
-                await rest.save_script_config(entity_id_slug, config)
-                await ws.send_command(
-                    "call_service", domain="script", service="reload",
-                )
-        except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Failed to create {domain} from blueprint: {e}",
-            })
+            await save_config(entity_id_slug, config)
+            await ws.reload(domain)
+        except (HAError, TimeoutError) as e:
+            return _error(f"Failed to create {domain} from blueprint: {e}")
 
         entity_id = f"{domain}.{entity_id_slug}"
         logger.info("Created %s from blueprint: %s", domain, entity_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "success": True,
             "domain": domain,
             "entity_id": entity_id,
@@ -274,4 +315,4 @@ def register_blueprint_tools(mcp_server):
                 f"{domain.capitalize()} created from blueprint "
                 f"'{blueprint_path}' as '{entity_id}'."
             ),
-        }, indent=2)
+        })
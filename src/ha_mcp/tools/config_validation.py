@@ -1,15 +1,128 @@
 """Config validation tools for checking HA configurations, automation configs, and YAML syntax."""
 
-import json
+import functools
 import logging
 
 from fastmcp import Context
 
+from ha_mcp.ha_client.models import HAError
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.yaml_util import validate_yaml_syntax, from_yaml
 
 logger = logging.getLogger(__name__)
 
+_SECTIONS = ("trigger", "condition", "action")
+
+_EMPTY_VALID = {"valid": True, "errors": [], "warnings": []}
+_NOT_OBJECT = {
+    "valid": False,
+    "errors": ["Config must be a JSON object."],
+    "warnings": [],
+}
+_EMPTY_VALID_JSON = json_util.dumps(_EMPTY_VALID)
+_NOT_OBJECT_JSON = json_util.dumps(_NOT_OBJECT)
+
+
+def _section_error(key: str, section) -> str | None:
+    """Return the error message for one validate_config section, if any."""
+    if isinstance(section, dict):
+        if section.get("valid") is False:
+            return f"{key}: {section.get('error', f'Invalid {key}')}"
+    elif isinstance(section, str) and section:
+        return f"{key}: {section}"
+    return None
+
+
+def _sections(config: dict) -> dict:
+    """Return the non-empty trigger/condition/action sections of *config*."""
+    return {key: config[key] for key in _SECTIONS if config.get(key)}
+
+
+def _report(result: dict) -> dict:
+    """Turn a validate_config result into a {valid, errors, warnings} report."""
+    errors = [
+        error
+        for error in (_section_error(key, result.get(key)) for key in _SECTIONS)
+        if error
+    ]
+    return {"valid": not errors, "errors": errors, "warnings": []}
+
+
+def _request_failed(exc: BaseException) -> dict:
+    return {
+        "valid": False,
+        "errors": [f"Validation request failed: {exc}"],
+        "warnings": [],
+    }
+
+
+async def _validate_many(ws, configs: list) -> list[dict]:
+    """Validate several configs with one batch of validate_config commands."""
+    reports: list[dict | None] = [None] * len(configs)
+    commands = []
+    pending = []
+    for index, config in enumerate(configs):
+        if not isinstance(config, dict):
+            reports[index] = _NOT_OBJECT
+            continue
+        sections = _sections(config)
+        if not sections:
+            reports[index] = _EMPTY_VALID
+            continue
+        commands.append({"type": "validate_config", **sections})
+        pending.append(index)
+
+    try:
+        results = await ws.send_commands(commands, return_exceptions=True)
+    except (HAError, TimeoutError) as exc:
+        logger.error("validate_config WS batch failed: %s", exc)
+        results = [exc] * len(commands)
+
+    for index, result in zip(pending, results):
+        if isinstance(result, Exception):
+            reports[index] = _request_failed(result)
+        else:
+            reports[index] = _report(result)
+    return reports
+
+
+# Iterative edits often resubmit the same YAML, so responses for inputs
+# under 64 KiB are memoized by text.
+_YAML_CACHE_MAX_LEN = 64 * 1024
+
+
+def _validate_yaml(yaml_text: str) -> str:
+    """Build the validate_yaml JSON response for *yaml_text*."""
+    is_valid, error_msg = validate_yaml_syntax(yaml_text)
+
+    if not is_valid:
+        return json_util.dumps({
+            "valid": False,
+            "error": error_msg,
+            "parsed": None,
+        })
+
+    try:
+        parsed = from_yaml(yaml_text)
+    except Exception as exc:
+        return json_util.dumps({
+            "valid": False,
+            "error": str(exc),
+            "parsed": None,
+        })
+
+    return json_util.dumps({
+        "valid": True,
+        "error": None,
+        "parsed": parsed,
+    })
+
+
+# An empty document is valid YAML that parses to null.
+_EMPTY_YAML_JSON = json_util.dumps({"valid": True, "error": None, "parsed": None})
+_validate_yaml_cached = functools.lru_cache(maxsize=256)(_validate_yaml)
+
 
 def register_config_validation_tools(mcp_server):
     """Register all config-validation tools on the MCP server."""
@@ -25,62 +138,45 @@ def register_config_validation_tools(mcp_server):
         Parameters:
             config: A JSON string containing an object with optional keys
                 'trigger' (array), 'condition' (array), and 'action' (array)
-                representing the parts of an automation to validate.
+                representing the parts of an automation to validate. May
+                also be an array of such objects to validate several
+                configs in one call.
 
         Returns a JSON object with:
             valid: bool indicating whether the configuration is valid.
             errors: list of error messages.
             warnings: list of warning messages.
+
+        For array input, returns an array of these objects in input order.
         """
         ws, _rest = get_clients(ctx)
 
         try:
-            parsed = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({
+            parsed = json_util.loads(config)
+        except json_util.JSONDecodeError as exc:
+            return json_util.dumps({
                 "valid": False,
                 "errors": [f"Invalid JSON: {exc}"],
                 "warnings": [],
-            }, indent=2)
-
-        triggers = parsed.get("trigger", [])
-        conditions = parsed.get("condition", [])
-        actions = parsed.get("action", [])
+            })
+        if isinstance(parsed, list):
+            return json_util.dumps(await _validate_many(ws, parsed))
+        if not isinstance(parsed, dict):
+            return _NOT_OBJECT_JSON
+
+        # Only send the sections that have content; with none there is
+        # nothing for Home Assistant to validate.
+        sections = _sections(parsed)
+        if not sections:
+            return _EMPTY_VALID_JSON
 
         try:
-            result = await ws.send_command(
-                "validate_config",
-                trigger=triggers,
-                condition=conditions,
-                action=actions,
-            )
-        except Exception as exc:
+            result = await ws.send_command("validate_config", **sections)
+        except (HAError, TimeoutError) as exc:
             logger.error("validate_config WS command failed: %s", exc)
-            return json.dumps({
-                "valid": False,
-                "errors": [f"Validation request failed: {exc}"],
-                "warnings": [],
-            }, indent=2)
-
-        errors = []
-        warnings = []
-
-        for key in ("trigger", "condition", "action"):
-            section = result.get(key, {})
-            if isinstance(section, dict):
-                if section.get("valid") is False:
-                    error_msg = section.get("error", f"Invalid {key}")
-                    errors.append(f"{key}: {error_msg}")
-            elif isinstance(section, str) and section:
-                errors.append(f"{key}: {section}")
+            return json_util.dumps(_request_failed(exc))
 
-        valid = len(errors) == 0
-
-        return json.dumps({
-            "valid": valid,
-            "errors": errors,
-            "warnings": warnings,
-        }, indent=2)
+        return json_util.dumps(_report(result))
 
     @mcp_server.tool()
     async def check_config(ctx: Context) -> str:
@@ -98,14 +194,14 @@ def register_config_validation_tools(mcp_server):
 
         try:
             result = await rest.check_config()
-        except Exception as exc:
+        except (HAError, TimeoutError) as exc:
             logger.error("check_config REST call failed: %s", exc)
-            return json.dumps({
+            return json_util.dumps({
                 "result": "error",
                 "errors": str(exc),
-            }, indent=2)
+            })
 
-        return json.dumps(result, indent=2)
+        return json_util.dumps(result)
 
     @mcp_server.tool()
     async def validate_yaml(ctx: Context, yaml_text: str) -> str:
@@ -122,26 +218,8 @@ def register_config_validation_tools(mcp_server):
             error: error message string if invalid, null if valid.
             parsed: the parsed YAML data structure if valid, null if invalid.
         """
-        is_valid, error_msg = validate_yaml_syntax(yaml_text)
-
-        if not is_valid:
-            return json.dumps({
-                "valid": False,
-                "error": error_msg,
-                "parsed": None,
-            }, indent=2)
-
-        try:
-            parsed = from_yaml(yaml_text)
-        except Exception as exc:
-            return json.dumps({
-                "valid": False,
-                "error": str(exc),
-                "parsed": None,
-            }, indent=2)
-
-        return json.dumps({
-            "valid": True,
-            "error": None,
-            "parsed": parsed,
-        }, indent=2)
+        if not yaml_text or yaml_text.isspace():
+            return _EMPTY_YAML_JSON
+        if len(yaml_text) < _YAML_CACHE_MAX_LEN:
+            return _validate_yaml_cached(yaml_text)
+        return _validate_yaml(yaml_text)
@@ -1,16 +1,30 @@
 """Lovelace dashboard management tools for Home Assistant."""
 
-import json
 import logging
+import time
 
+import orjson
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 
 logger = logging.getLogger(__name__)
 
 
+# Lovelace configs are cached briefly as serialized bytes, keyed by dashboard
+# URL path (None for the default dashboard). Decoding the bytes gives every
+# caller its own copy to modify, and saves refresh the entry in place, so a
+# run of view/card edits only fetches the config once.
+_CONFIG_CACHE_TTL = 5.0
+_config_cache: dict[str | None, tuple[float, bytes]] = {}
+
+# The dashboard list changes only when dashboards are added or removed.
+_DASHBOARDS_CACHE_TTL = 10.0
+_dashboards_cache: dict[str, tuple[float, list]] = {}
+
+
 async def _get_dashboard_config(ws, dashboard_id: str | None = None) -> dict:
     """Fetch the full Lovelace config for a dashboard.
 
@@ -19,50 +33,98 @@ async def _get_dashboard_config(ws, dashboard_id: str | None = None) -> dict:
         dashboard_id: URL path of the dashboard, or None for the default dashboard.
 
     Returns:
-        The dashboard configuration dict.
+        The dashboard configuration dict. Callers may modify it freely.
     """
+    key = dashboard_id or None
+    entry = _config_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return orjson.loads(entry[1])
+
     if dashboard_id:
-        return await ws.send_command("lovelace/config", url_path=dashboard_id)
-    return await ws.send_command("lovelace/config")
+        config = await ws.send_command("lovelace/config", url_path=dashboard_id)
+    else:
+        config = await ws.send_command("lovelace/config")
+    _config_cache[key] = (time.monotonic() + _CONFIG_CACHE_TTL, orjson.dumps(config))
+    return config
 
 
 async def _save_dashboard_config(
-    ws, config: dict, dashboard_id: str | None = None
+    ws, config: dict | orjson.Fragment, dashboard_id: str | None = None
 ) -> None:
     """Save a full Lovelace config for a dashboard.
 
     Args:
         ws: The WebSocket client.
-        config: The complete dashboard configuration to save.
+        config: The complete dashboard configuration to save, either as a
+            dict or as already-serialized JSON wrapped in ``orjson.Fragment``.
         dashboard_id: URL path of the dashboard, or None for the default dashboard.
     """
+    key = dashboard_id or None
+    _config_cache.pop(key, None)
     if dashboard_id:
         await ws.send_command(
             "lovelace/config/save", config=config, url_path=dashboard_id
         )
     else:
         await ws.send_command("lovelace/config/save", config=config)
+    _config_cache[key] = (time.monotonic() + _CONFIG_CACHE_TTL, orjson.dumps(config))
+
+
+async def _list_dashboards(ws) -> list:
+    """Return the ``lovelace/dashboards/list`` response, cached briefly.
+
+    The list is shared between callers and must not be mutated.
+    """
+    entry = _dashboards_cache.get("list")
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    dashboards = await ws.send_command("lovelace/dashboards/list")
+    _dashboards_cache["list"] = (time.monotonic() + _DASHBOARDS_CACHE_TTL, dashboards)
+    return dashboards
+
+
+def _error(message: str) -> str:
+    return json_util.dumps({"error": message})
+
+
+def _bad_json(field: str, exc: Exception) -> str:
+    return _error(f"Invalid JSON in {field}: {exc}")
+
+
+def _view_out_of_range(index: int, count: int) -> str:
+    return _error(
+        f"View index {index} out of range. "
+        f"Dashboard has {count} view(s) (0-{count - 1})."
+    )
+
+
+def _card_out_of_range(index: int, count: int) -> str:
+    return _error(
+        f"Card index {index} out of range. "
+        f"View has {count} card(s) (0-{count - 1})."
+    )
 
 
 def register_dashboard_tools(mcp_server):
     """Register all Lovelace dashboard management tools on the MCP server."""
 
     @mcp_server.tool()
-    async def list_dashboards(ctx: Context) -> str:
+    async def list_dashboards(ctx: Context, pretty: bool = False) -> str:
         """List all Lovelace dashboards configured in Home Assistant.
 
         Returns a JSON array of dashboard summaries, each containing fields
         such as id, url_path, title, mode, and require_admin.
         Use this to discover available dashboards before retrieving their
-        full configuration.
+        full configuration. Set pretty to True for indented output.
         """
         ws, _rest = get_clients(ctx)
-        dashboards = await ws.send_command("lovelace/dashboards/list")
-        return json.dumps(dashboards, indent=2)
+        dashboards = await _list_dashboards(ws)
+        return json_util.dumps(dashboards, pretty=pretty)
 
     @mcp_server.tool()
     async def get_dashboard_config(
-        ctx: Context, dashboard_id: str | None = None
+        ctx: Context, dashboard_id: str | None = None, pretty: bool = False
     ) -> str:
         """Get the full Lovelace configuration of a dashboard.
 
@@ -70,13 +132,14 @@ def register_dashboard_tools(mcp_server):
             dashboard_id: The URL path of the dashboard (e.g. 'energy',
                 'my-custom-dashboard'). Omit or pass None to get the
                 default/overview dashboard configuration.
+            pretty: If True, indent the returned JSON for readability.
 
         Returns the complete Lovelace configuration as JSON, including
         the views array and any top-level dashboard settings.
         """
         ws, _rest = get_clients(ctx)
         config = await _get_dashboard_config(ws, dashboard_id)
-        return json.dumps(config, indent=2)
+        return json_util.dumps(config, pretty=pretty)
 
     @mcp_server.tool()
     async def save_dashboard_config(
@@ -108,9 +171,9 @@ def register_dashboard_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         try:
-            config_dict = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in config: {exc}"})
+            config_dict = json_util.loads(config)
+        except json_util.JSONDecodeError as exc:
+            return _bad_json("config", exc)
 
         identifier = dashboard_id or "default"
 
@@ -124,21 +187,26 @@ def register_dashboard_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Dashboard config save cancelled by user.",
             })
 
-        await _save_dashboard_config(ws, config_dict, dashboard_id)
+        # The text already parsed as valid JSON; send it verbatim rather
+        # than re-encoding the parsed dict.
+        await _save_dashboard_config(ws, orjson.Fragment(config), dashboard_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "saved",
             "dashboard_id": identifier,
         })
 
     @mcp_server.tool()
     async def get_view(
-        ctx: Context, view_index: int, dashboard_id: str | None = None
+        ctx: Context,
+        view_index: int,
+        dashboard_id: str | None = None,
+        pretty: bool = False,
     ) -> str:
         """Get the configuration of a single view from a dashboard.
 
@@ -146,6 +214,7 @@ def register_dashboard_tools(mcp_server):
             view_index: Zero-based index of the view to retrieve.
             dashboard_id: The URL path of the dashboard. Omit for the
                 default dashboard.
+            pretty: If True, indent the returned JSON for readability.
 
         Returns the view configuration as JSON, including its title,
         cards, and any other view-level settings.
@@ -155,12 +224,9 @@ def register_dashboard_tools(mcp_server):
 
         views = config.get("views", [])
         if view_index < 0 or view_index >= len(views):
-            return json.dumps({
-                "error": f"View index {view_index} out of range. "
-                         f"Dashboard has {len(views)} view(s) (0-{len(views) - 1}).",
-            })
+            return _view_out_of_range(view_index, len(views))
 
-        return json.dumps(views[view_index], indent=2)
+        return json_util.dumps(views[view_index], pretty=pretty)
 
     @mcp_server.tool()
     async def add_view(
@@ -193,45 +259,51 @@ def register_dashboard_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         try:
-            new_view = json.loads(view_config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in view_config: {exc}"})
+            new_view = json_util.loads(view_config)
+        except json_util.JSONDecodeError as exc:
+            return _bad_json("view_config", exc)
 
         config = await _get_dashboard_config(ws, dashboard_id)
-        views = config.get("views", [])
+        views = config.setdefault("views", [])
 
         if position is not None:
             if position < 0 or position > len(views):
-                return json.dumps({
-                    "error": f"Position {position} out of range. "
-                             f"Valid range is 0-{len(views)}.",
-                })
+                return _error(
+                    f"Position {position} out of range. "
+                    f"Valid range is 0-{len(views)}."
+                )
             views.insert(position, new_view)
         else:
             views.append(new_view)
 
-        config["views"] = views
         identifier = dashboard_id or "default"
+        actual_position = position if position is not None else len(views) - 1
+        preview = {
+            "action": "insert",
+            "position": actual_position,
+            "new_view": new_view,
+            "dashboard_id": identifier,
+            "existing_view_count": len(views) - 1,
+        }
 
         confirmed = await confirm_change(
             ctx=ctx,
             action="ADD VIEW",
             entity_type="dashboard",
             identifier=f"{identifier} - {new_view.get('title', 'Untitled')}",
-            config=config,
+            config=preview,
             skip_confirm=skip_confirm,
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Add view cancelled by user.",
             })
 
         await _save_dashboard_config(ws, config, dashboard_id)
 
-        actual_position = position if position is not None else len(views) - 1
-        return json.dumps({
+        return json_util.dumps({
             "status": "added",
             "view_title": new_view.get("title", "Untitled"),
             "view_index": actual_position,
@@ -261,21 +333,17 @@ def register_dashboard_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         try:
-            new_view = json.loads(view_config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in view_config: {exc}"})
+            new_view = json_util.loads(view_config)
+        except json_util.JSONDecodeError as exc:
+            return _bad_json("view_config", exc)
 
         config = await _get_dashboard_config(ws, dashboard_id)
         views = config.get("views", [])
 
         if view_index < 0 or view_index >= len(views):
-            return json.dumps({
-                "error": f"View index {view_index} out of range. "
-                         f"Dashboard has {len(views)} view(s) (0-{len(views) - 1}).",
-            })
+            return _view_out_of_range(view_index, len(views))
 
         views[view_index] = new_view
-        config["views"] = views
         identifier = dashboard_id or "default"
 
         confirmed = await confirm_change(
@@ -283,19 +351,19 @@ def register_dashboard_tools(mcp_server):
             action="UPDATE VIEW",
             entity_type="dashboard",
             identifier=f"{identifier} - view[{view_index}]",
-            config=config,
+            config=new_view,
             skip_confirm=skip_confirm,
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Update view cancelled by user.",
             })
 
         await _save_dashboard_config(ws, config, dashboard_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "updated",
             "view_index": view_index,
             "view_title": new_view.get("title", "Untitled"),
@@ -326,13 +394,9 @@ def register_dashboard_tools(mcp_server):
         views = config.get("views", [])
 
         if view_index < 0 or view_index >= len(views):
-            return json.dumps({
-                "error": f"View index {view_index} out of range. "
-                         f"Dashboard has {len(views)} view(s) (0-{len(views) - 1}).",
-            })
+            return _view_out_of_range(view_index, len(views))
 
         removed_view = views.pop(view_index)
-        config["views"] = views
         identifier = dashboard_id or "default"
 
         confirmed = await confirm_change(
@@ -345,14 +409,14 @@ def register_dashboard_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Delete view cancelled by user.",
             })
 
         await _save_dashboard_config(ws, config, dashboard_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "deleted",
             "deleted_view_title": removed_view.get("title", "Untitled"),
             "deleted_view_index": view_index,
@@ -387,23 +451,19 @@ def register_dashboard_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         try:
-            new_card = json.loads(card_config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in card_config: {exc}"})
+            new_card = json_util.loads(card_config)
+        except json_util.JSONDecodeError as exc:
+            return _bad_json("card_config", exc)
 
         config = await _get_dashboard_config(ws, dashboard_id)
         views = config.get("views", [])
 
         if view_index < 0 or view_index >= len(views):
-            return json.dumps({
-                "error": f"View index {view_index} out of range. "
-                         f"Dashboard has {len(views)} view(s) (0-{len(views) - 1}).",
-            })
+            return _view_out_of_range(view_index, len(views))
 
         view = views[view_index]
-        cards = view.get("cards", [])
+        cards = view.setdefault("cards", [])
         cards.append(new_card)
-        view["cards"] = cards
         identifier = dashboard_id or "default"
 
         confirmed = await confirm_change(
@@ -416,14 +476,14 @@ def register_dashboard_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Add card cancelled by user.",
             })
 
         await _save_dashboard_config(ws, config, dashboard_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "added",
             "card_type": new_card.get("type", "unknown"),
             "card_index": len(cards) - 1,
@@ -455,30 +515,23 @@ def register_dashboard_tools(mcp_server):
         ws, _rest = get_clients(ctx)
 
         try:
-            new_card = json.loads(card_config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in card_config: {exc}"})
+            new_card = json_util.loads(card_config)
+        except json_util.JSONDecodeError as exc:
+            return _bad_json("card_config", exc)
 
         config = await _get_dashboard_config(ws, dashboard_id)
         views = config.get("views", [])
 
         if view_index < 0 or view_index >= len(views):
-            return json.dumps({
-                "error": f"View index {view_index} out of range. "
-                         f"Dashboard has {len(views)} view(s) (0-{len(views) - 1}).",
-            })
+            return _view_out_of_range(view_index, len(views))
 
         view = views[view_index]
         cards = view.get("cards", [])
 
         if card_index < 0 or card_index >= len(cards):
-            return json.dumps({
-                "error": f"Card index {card_index} out of range. "
-                         f"View has {len(cards)} card(s) (0-{len(cards) - 1}).",
-            })
+            return _card_out_of_range(card_index, len(cards))
 
         cards[card_index] = new_card
-        view["cards"] = cards
         identifier = dashboard_id or "default"
 
         confirmed = await confirm_change(
@@ -491,14 +544,14 @@ def register_dashboard_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "status": "cancelled",
                 "message": "Update card cancelled by user.",
             })
 
         await _save_dashboard_config(ws, config, dashboard_id)
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "updated",
             "card_type": new_card.get("type", "unknown"),
             "card_index": card_index,
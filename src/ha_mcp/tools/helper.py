@@ -1,11 +1,11 @@
 """Helper (input entity) tools for managing Home Assistant input_* helpers via WebSocket API."""
 
-import json
 import logging
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 
 logger = logging.getLogger(__name__)
@@ -18,11 +18,12 @@ VALID_HELPER_TYPES = (
     "input_datetime",
     "input_button",
 )
+_HELPER_DOMAINS = frozenset(VALID_HELPER_TYPES)
 
 
 def _validate_helper_type(helper_type: str) -> None:
     """Raise ValueError if helper_type is not one of the supported types."""
-    if helper_type not in VALID_HELPER_TYPES:
+    if helper_type not in _HELPER_DOMAINS:
         raise ValueError(
             f"Invalid helper_type '{helper_type}'. "
             f"Must be one of: {', '.join(VALID_HELPER_TYPES)}"
@@ -54,22 +55,17 @@ def register_helper_tools(mcp_server):
             _validate_helper_type(helper_type)
 
         _ws, rest = get_clients(ctx)
-        states = await rest.get_states()
 
         if helper_type:
-            prefix = f"{helper_type}."
-            helpers = [s for s in states if s.get("entity_id", "").startswith(prefix)]
+            helpers = await rest.get_states_by_domain(helper_type)
         else:
             helpers = [
                 s
-                for s in states
-                if any(
-                    s.get("entity_id", "").startswith(f"{ht}.")
-                    for ht in VALID_HELPER_TYPES
-                )
+                for s in await rest.get_states()
+                if s["entity_id"].partition(".")[0] in _HELPER_DOMAINS
             ]
 
-        return json.dumps(helpers, indent=2)
+        return json_util.dumps(helpers)
 
     @mcp_server.tool()
     async def create_helper(
@@ -99,12 +95,12 @@ def register_helper_tools(mcp_server):
         _validate_helper_type(helper_type)
 
         try:
-            config_dict = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in config: {exc}"})
+            config_dict = json_util.loads(config)
+        except json_util.JSONDecodeError as exc:
+            return json_util.dumps({"error": f"Invalid JSON in config: {exc}"})
 
         if not isinstance(config_dict, dict):
-            return json.dumps({"error": "config must be a JSON object"})
+            return json_util.dumps({"error": "config must be a JSON object"})
 
         name = config_dict.get("name", helper_type)
 
@@ -117,15 +113,15 @@ def register_helper_tools(mcp_server):
             skip_confirm=skip_confirm,
         )
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Create cancelled by user"})
+            return json_util.dumps({"status": "cancelled", "message": "Create cancelled by user"})
 
         ws, _rest = get_clients(ctx)
         try:
             result = await ws.send_command(f"{helper_type}/create", **config_dict)
-            return json.dumps({"status": "created", "result": result}, indent=2)
+            return json_util.dumps({"status": "created", "result": result})
         except Exception as exc:
             logger.error("Failed to create %s helper '%s': %s", helper_type, name, exc)
-            return json.dumps({"error": str(exc)})
+            return json_util.dumps({"error": str(exc)})
 
     @mcp_server.tool()
     async def update_helper(
@@ -154,17 +150,17 @@ def register_helper_tools(mcp_server):
         _validate_helper_type(helper_type)
 
         try:
-            config_dict = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in config: {exc}"})
+            config_dict = json_util.loads(config)
+        except json_util.JSONDecodeError as exc:
+            return json_util.dumps({"error": f"Invalid JSON in config: {exc}"})
 
         if not isinstance(config_dict, dict):
-            return json.dumps({"error": "config must be a JSON object"})
+            return json_util.dumps({"error": "config must be a JSON object"})
 
         # Verify entity_id domain matches helper_type
         domain = entity_id.split(".")[0] if "." in entity_id else ""
         if domain != helper_type:
-            return json.dumps({
+            return json_util.dumps({
                 "error": f"entity_id domain '{domain}' does not match helper_type '{helper_type}'"
             })
 
@@ -187,7 +183,7 @@ def register_helper_tools(mcp_server):
             skip_confirm=skip_confirm,
         )
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Update cancelled by user"})
+            return json_util.dumps({"status": "cancelled", "message": "Update cancelled by user"})
 
         ws, _rest = get_clients(ctx)
 
@@ -200,10 +196,10 @@ def register_helper_tools(mcp_server):
             result = await ws.send_command(
                 f"{helper_type}/update", **update_payload
             )
-            return json.dumps({"status": "updated", "result": result}, indent=2)
+            return json_util.dumps({"status": "updated", "result": result})
         except Exception as exc:
             logger.error("Failed to update %s '%s': %s", helper_type, entity_id, exc)
-            return json.dumps({"error": str(exc)})
+            return json_util.dumps({"error": str(exc)})
 
     @mcp_server.tool()
     async def delete_helper(
@@ -232,7 +228,7 @@ def register_helper_tools(mcp_server):
         # Verify entity_id domain matches helper_type
         domain = entity_id.split(".")[0] if "." in entity_id else ""
         if domain != helper_type:
-            return json.dumps({
+            return json_util.dumps({
                 "error": f"entity_id domain '{domain}' does not match helper_type '{helper_type}'"
             })
 
@@ -255,7 +251,7 @@ def register_helper_tools(mcp_server):
             skip_confirm=skip_confirm,
         )
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Delete cancelled by user"})
+            return json_util.dumps({"status": "cancelled", "message": "Delete cancelled by user"})
 
         ws, _rest = get_clients(ctx)
 
@@ -264,7 +260,7 @@ def register_helper_tools(mcp_server):
                 f"{helper_type}/delete",
                 **{helper_type + "_id": entity_id},
             )
-            return json.dumps({"status": "deleted", "entity_id": entity_id, "result": result}, indent=2)
+            return json_util.dumps({"status": "deleted", "entity_id": entity_id, "result": result})
         except Exception as exc:
             logger.error("Failed to delete %s '%s': %s", helper_type, entity_id, exc)
-            return json.dumps({"error": str(exc)})
+            return json_util.dumps({"error": str(exc)})
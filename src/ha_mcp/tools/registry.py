@@ -1,11 +1,19 @@
 """Registry tools for querying Home Assistant device, entity, area, floor, and label registries."""
 
-import json
+import asyncio
 import logging
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
+from ha_mcp.util.registry_cache import (
+    get_entity_entry,
+    get_entity_index,
+    get_registry,
+    get_registry_json,
+    search_entity_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,25 +36,20 @@ def register_registry_tools(mcp_server):
             model: Filter by device model (case-insensitive).
         """
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/device_registry/list")
-        devices = result
+        devices = await get_registry(ws, "device")
 
-        if area_id:
-            devices = [d for d in devices if d.get("area_id") == area_id]
-        if manufacturer:
+        if area_id or manufacturer or model:
+            mfr = manufacturer.lower() if manufacturer else None
+            mdl = model.lower() if model else None
             devices = [
                 d
                 for d in devices
-                if (d.get("manufacturer") or "").lower() == manufacturer.lower()
-            ]
-        if model:
-            devices = [
-                d
-                for d in devices
-                if (d.get("model") or "").lower() == model.lower()
+                if (not area_id or d.get("area_id") == area_id)
+                and (not mfr or (d.get("manufacturer") or "").lower() == mfr)
+                and (not mdl or (d.get("model") or "").lower() == mdl)
             ]
 
-        return json.dumps(devices, indent=2)
+        return json_util.dumps(devices)
 
     @mcp_server.tool()
     async def list_entities(
@@ -54,6 +57,8 @@ def register_registry_tools(mcp_server):
         domain: str | None = None,
         device_id: str | None = None,
         area_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> str:
         """List all entities registered in Home Assistant with optional filters.
 
@@ -61,43 +66,57 @@ def register_registry_tools(mcp_server):
             domain: Filter by domain (prefix match on entity_id, e.g. 'light', 'switch').
             device_id: Filter by device ID.
             area_id: Filter by area ID.
+            limit: Maximum number of entities to return (default: all).
+            offset: Number of matching entities to skip, for paging with limit.
         """
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/entity_registry/list")
-        entities = result
 
+        # Start from an indexed bucket; the filters below narrow it further.
         if domain:
-            prefix = domain if domain.endswith(".") else domain + "."
+            index = await get_entity_index(ws, "domain")
+            entities = index.get(domain.removesuffix("."), [])
+        elif device_id:
+            index = await get_entity_index(ws, "device_id")
+            entities = index.get(device_id, [])
+        elif area_id:
+            index = await get_entity_index(ws, "area_id")
+            entities = index.get(area_id, [])
+        else:
+            entities = await get_registry(ws, "entity")
+
+        if device_id or area_id:
             entities = [
-                e for e in entities if (e.get("entity_id") or "").startswith(prefix)
+                e
+                for e in entities
+                if (not device_id or e.get("device_id") == device_id)
+                and (not area_id or e.get("area_id") == area_id)
             ]
-        if device_id:
-            entities = [e for e in entities if e.get("device_id") == device_id]
-        if area_id:
-            entities = [e for e in entities if e.get("area_id") == area_id]
 
-        return json.dumps(entities, indent=2)
+        offset = max(offset, 0)
+        if limit is not None:
+            entities = entities[offset:offset + max(limit, 0)]
+        elif offset:
+            entities = entities[offset:]
+
+        return json_util.dumps(entities)
 
     @mcp_server.tool()
     async def list_areas(ctx: Context) -> str:
         """List all areas registered in Home Assistant."""
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/area_registry/list")
-        return json.dumps(result, indent=2)
+        return await get_registry_json(ws, "area")
 
     @mcp_server.tool()
     async def list_floors(ctx: Context) -> str:
         """List all floors registered in Home Assistant."""
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/floor_registry/list")
-        return json.dumps(result, indent=2)
+        return await get_registry_json(ws, "floor")
 
     @mcp_server.tool()
     async def list_labels(ctx: Context) -> str:
         """List all labels registered in Home Assistant."""
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/label_registry/list")
-        return json.dumps(result, indent=2)
+        return await get_registry_json(ws, "label")
 
     @mcp_server.tool()
     async def get_entity_details(ctx: Context, entity_id: str) -> str:
@@ -108,16 +127,10 @@ def register_registry_tools(mcp_server):
         """
         ws, rest = get_clients(ctx)
 
-        # Get registry info for all entities and find the matching one
-        registry_list = await ws.send_command("config/entity_registry/list")
-        registry_entry = None
-        for entry in registry_list:
-            if entry.get("entity_id") == entity_id:
-                registry_entry = entry
-                break
-
-        # Get live state via REST API
-        live_state = await rest.get_state(entity_id)
+        # Registry entry and live state are independent; fetch them together
+        registry_entry, live_state = await asyncio.gather(
+            get_entity_entry(ws, entity_id), rest.get_state(entity_id)
+        )
 
         combined = {
             "entity_id": entity_id,
@@ -125,7 +138,7 @@ def register_registry_tools(mcp_server):
             "state": live_state,
         }
 
-        return json.dumps(combined, indent=2)
+        return json_util.dumps(combined)
 
     @mcp_server.tool()
     async def search_entities(
@@ -140,30 +153,9 @@ def register_registry_tools(mcp_server):
             domain: Optionally restrict search to a specific domain (e.g. 'light', 'switch').
         """
         ws, rest = get_clients(ctx)
-        result = await ws.send_command("config/entity_registry/list")
-        entities = result
-
-        # Optionally filter by domain first
-        if domain:
-            prefix = domain if domain.endswith(".") else domain + "."
-            entities = [
-                e for e in entities if (e.get("entity_id") or "").startswith(prefix)
-            ]
 
         # Fuzzy search: case-insensitive substring match on entity_id, name, and
         # original_name fields
-        query_lower = query.lower()
-        matches = []
-        for entity in entities:
-            entity_id = (entity.get("entity_id") or "").lower()
-            name = (entity.get("name") or "").lower()
-            original_name = (entity.get("original_name") or "").lower()
-
-            if (
-                query_lower in entity_id
-                or query_lower in name
-                or query_lower in original_name
-            ):
-                matches.append(entity)
-
-        return json.dumps(matches, indent=2)
+        matches = await search_entity_registry(ws, query, domain)
+
+        return json_util.dumps(matches)
@@ -1,16 +1,32 @@
 """Scene CRUD tools for managing Home Assistant scenes."""
 
-import json
 import logging
 import uuid
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for a state without attributes; never mutated.
+_EMPTY: dict = {}
+
+_NOT_OBJECT = json_util.dumps({"error": "config must be a JSON object"})
+
+
+def _parse_config(config: str) -> dict | str:
+    """Parse a scene config JSON string, or return the error reply."""
+    try:
+        scene_config = json_util.loads(config)
+    except json_util.JSONDecodeError as exc:
+        return json_util.dumps({"error": f"Invalid JSON in config: {exc}"})
+    if not isinstance(scene_config, dict):
+        return _NOT_OBJECT
+    return scene_config
+
 
 def register_scene_tools(mcp_server):
     """Register all scene management tools on the MCP server."""
@@ -24,19 +40,17 @@ def register_scene_tools(mcp_server):
         before retrieving full configuration details.
         """
         _ws, rest = get_clients(ctx)
-        states = await rest.get_states()
+        states = await rest.get_states_by_domain("scene")
 
         scenes = []
         for s in states:
-            entity_id = s.get("entity_id", "")
-            if entity_id.startswith("scene."):
-                scenes.append({
-                    "entity_id": entity_id,
-                    "friendly_name": s.get("attributes", {}).get("friendly_name", ""),
-                    "state": s.get("state", ""),
-                })
+            scenes.append({
+                "entity_id": s["entity_id"],
+                "friendly_name": (s.get("attributes") or _EMPTY).get("friendly_name", ""),
+                "state": s.get("state", ""),
+            })
 
-        return json.dumps(scenes, indent=2)
+        return json_util.dumps(scenes)
 
     @mcp_server.tool()
     async def get_scene(ctx: Context, scene_id: str) -> str:
@@ -50,8 +64,7 @@ def register_scene_tools(mcp_server):
         entities, icon, and any other stored fields.
         """
         _ws, rest = get_clients(ctx)
-        config = await rest.get_scene_config(scene_id)
-        return json.dumps(config, indent=2)
+        return json_util.dumps_raw(await rest.get_scene_config_raw(scene_id))
 
     @mcp_server.tool()
     async def create_scene(
@@ -80,10 +93,9 @@ def register_scene_tools(mcp_server):
         """
         ws, rest = get_clients(ctx)
 
-        try:
-            scene_config = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in config: {exc}"})
+        scene_config = _parse_config(config)
+        if isinstance(scene_config, str):
+            return scene_config
 
         # Generate an id if not provided
         scene_id = scene_config.pop("id", None) or uuid.uuid4().hex
@@ -98,16 +110,14 @@ def register_scene_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Scene creation cancelled by user."})
+            return json_util.dumps({"status": "cancelled", "message": "Scene creation cancelled by user."})
 
         await rest.save_scene_config(scene_id, scene_config)
 
         # Reload the scene integration so the new scene is available immediately
-        await ws.send_command(
-            "call_service", domain="scene", service="reload"
-        )
+        await ws.reload("scene")
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "created",
             "scene_id": scene_id,
             "name": scene_config.get("name", ""),
@@ -131,19 +141,21 @@ def register_scene_tools(mcp_server):
         """
         ws, rest = get_clients(ctx)
 
+        # Parse the updates before fetching, so bad input costs no request
+        updates = _parse_config(config)
+        if isinstance(updates, str):
+            return updates
+
         # Fetch current config
         try:
             current_config = await rest.get_scene_config(scene_id)
         except Exception as exc:
-            return json.dumps({"error": f"Failed to get scene config: {exc}"})
-
-        try:
-            updates = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({"error": f"Invalid JSON in config: {exc}"})
+            return json_util.dumps({"error": f"Failed to get scene config: {exc}"})
 
-        # Merge updates into current config
-        merged_config = {**current_config, **updates}
+        # Merge updates into current config. The fetched config is decoded
+        # fresh for this call, so it can be updated in place.
+        merged_config = current_config
+        merged_config.update(updates)
         # Remove 'id' from the payload if present – it's used as the URL key
         merged_config.pop("id", None)
 
@@ -157,16 +169,14 @@ def register_scene_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Scene update cancelled by user."})
+            return json_util.dumps({"status": "cancelled", "message": "Scene update cancelled by user."})
 
         await rest.save_scene_config(scene_id, merged_config)
 
         # Reload the scene integration so changes take effect immediately
-        await ws.send_command(
-            "call_service", domain="scene", service="reload"
-        )
+        await ws.reload("scene")
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "updated",
             "scene_id": scene_id,
             "name": merged_config.get("name", ""),
@@ -191,7 +201,7 @@ def register_scene_tools(mcp_server):
         try:
             current_config = await rest.get_scene_config(scene_id)
         except Exception as exc:
-            return json.dumps({"error": f"Failed to get scene config: {exc}"})
+            return json_util.dumps({"error": f"Failed to get scene config: {exc}"})
 
         confirmed = await confirm_change(
             ctx=ctx,
@@ -203,16 +213,14 @@ def register_scene_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({"status": "cancelled", "message": "Scene deletion cancelled by user."})
+            return json_util.dumps({"status": "cancelled", "message": "Scene deletion cancelled by user."})
 
         await rest.delete_scene_config(scene_id)
 
         # Reload the scene integration so the deletion is reflected immediately
-        await ws.send_command(
-            "call_service", domain="scene", service="reload"
-        )
+        await ws.reload("scene")
 
-        return json.dumps({
+        return json_util.dumps({
             "status": "deleted",
             "scene_id": scene_id,
             "name": current_config.get("name", ""),
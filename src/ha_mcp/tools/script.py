@@ -1,18 +1,50 @@
 """Script CRUD tools for managing Home Assistant scripts with dry-run + confirm."""
 
-import json
+import asyncio
 import logging
 import re
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.dry_run import confirm_change
 
 logger = logging.getLogger(__name__)
 
 # Pattern for valid HA script IDs: lowercase letters, digits, underscores only.
-_VALID_SCRIPT_ID = re.compile(r"^[a-z][a-z0-9_]*$")
+_VALID_SCRIPT_ID = re.compile(r"[a-z][a-z0-9_]*")
+
+# Shared stand-in for a state without attributes; never mutated.
+_EMPTY: dict = {}
+
+_NOT_OBJECT = json_util.dumps({
+    "success": False,
+    "error": "Config must be a JSON object.",
+})
+
+
+def _parse_config(config: str) -> dict | str:
+    """Parse a script config JSON string, or return the error reply."""
+    try:
+        script_config = json_util.loads(config)
+    except json_util.JSONDecodeError as exc:
+        return json_util.dumps({
+            "success": False,
+            "error": f"Invalid JSON in config: {exc}",
+        })
+    if not isinstance(script_config, dict):
+        return _NOT_OBJECT
+    return script_config
+
+
+async def _validate_sequence(ws, sequence: list) -> dict:
+    """Validate a script's action sequence for the confirmation preview."""
+    try:
+        await ws.send_command("validate_config", action=sequence)
+    except Exception as exc:
+        return {"valid": False, "errors": [str(exc)], "warnings": []}
+    return {"valid": True, "errors": [], "warnings": []}
 
 
 def register_script_tools(mcp_server):
@@ -31,22 +63,19 @@ def register_script_tools(mcp_server):
         Use this to discover existing scripts before creating or modifying them.
         """
         _ws, rest = get_clients(ctx)
-        states = await rest.get_states()
+        states = await rest.get_states_by_domain("script")
 
         scripts = []
         for s in states:
-            entity_id = s.get("entity_id", "")
-            if not entity_id.startswith("script."):
-                continue
-            attrs = s.get("attributes", {})
+            attrs = s.get("attributes") or _EMPTY
             scripts.append({
-                "entity_id": entity_id,
+                "entity_id": s["entity_id"],
                 "friendly_name": attrs.get("friendly_name", ""),
                 "state": s.get("state", "unknown"),
                 "last_triggered": attrs.get("last_triggered"),
             })
 
-        return json.dumps(scripts, indent=2)
+        return json_util.dumps(scripts)
 
     @mcp_server.tool()
     async def get_script(ctx: Context, script_id: str) -> str:
@@ -60,8 +89,7 @@ def register_script_tools(mcp_server):
         sequence, fields, mode, and any other configured options.
         """
         _ws, rest = get_clients(ctx)
-        config = await rest.get_script_config(script_id)
-        return json.dumps(config, indent=2)
+        return json_util.dumps_raw(await rest.get_script_config_raw(script_id))
 
     @mcp_server.tool()
     async def create_script(
@@ -87,14 +115,14 @@ def register_script_tools(mcp_server):
             skip_confirm: If True, skip the dry-run confirmation prompt.
                 Set this only when the calling client does not support elicitation.
 
-        The script configuration is validated against Home Assistant before saving.
-        A dry-run preview is shown for confirmation unless skip_confirm is True.
+        Unless skip_confirm is True, the script configuration is validated
+        against Home Assistant and a dry-run preview is shown for confirmation.
         """
         ws, rest = get_clients(ctx)
 
         # Validate script_id format
-        if not _VALID_SCRIPT_ID.match(script_id):
-            return json.dumps({
+        if not _VALID_SCRIPT_ID.fullmatch(script_id):
+            return json_util.dumps({
                 "success": False,
                 "error": (
                     f"Invalid script_id '{script_id}'. Must contain only lowercase "
@@ -103,39 +131,18 @@ def register_script_tools(mcp_server):
             })
 
         # Parse config JSON
-        try:
-            script_config = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid JSON in config: {exc}",
-            })
-
-        if not isinstance(script_config, dict):
-            return json.dumps({
-                "success": False,
-                "error": "Config must be a JSON object.",
-            })
+        script_config = _parse_config(config)
+        if isinstance(script_config, str):
+            return script_config
 
-        # Validate the action sequence via WebSocket
-        sequence = script_config.get("sequence", [])
+        # Validate the action sequence via WebSocket. The result only feeds
+        # the confirmation preview, so skip it when there is no preview;
+        # otherwise confirm_change awaits it while rendering the preview.
         validation_result = None
-        try:
-            result = await ws.send_command(
-                "validate_config",
-                action=sequence,
+        if not skip_confirm:
+            validation_result = _validate_sequence(
+                ws, script_config.get("sequence", [])
             )
-            validation_result = {
-                "valid": True,
-                "errors": [],
-                "warnings": [],
-            }
-        except Exception as exc:
-            validation_result = {
-                "valid": False,
-                "errors": [str(exc)],
-                "warnings": [],
-            }
 
         # Dry-run confirmation
         confirmed = await confirm_change(
@@ -149,7 +156,7 @@ def register_script_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "success": False,
                 "error": "Change cancelled by user.",
             })
@@ -158,14 +165,10 @@ def register_script_tools(mcp_server):
         await rest.save_script_config(script_id, script_config)
 
         # Reload scripts so HA picks up the change
-        await ws.send_command(
-            "call_service",
-            domain="script",
-            service="reload",
-        )
+        await ws.reload("script")
 
         logger.info("Created script: %s", script_id)
-        return json.dumps({
+        return json_util.dumps({
             "success": True,
             "script_id": script_id,
             "entity_id": f"script.{script_id}",
@@ -193,49 +196,27 @@ def register_script_tools(mcp_server):
         """
         ws, rest = get_clients(ctx)
 
-        # Verify the script exists by fetching current config
-        try:
-            _current = await rest.get_script_config(script_id)
-        except Exception as exc:
-            return json.dumps({
-                "success": False,
-                "error": f"Script '{script_id}' not found: {exc}",
-            })
-
         # Parse new config JSON
-        try:
-            script_config = json.loads(config)
-        except json.JSONDecodeError as exc:
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid JSON in config: {exc}",
-            })
+        script_config = _parse_config(config)
+        if isinstance(script_config, str):
+            return script_config
 
-        if not isinstance(script_config, dict):
-            return json.dumps({
-                "success": False,
-                "error": "Config must be a JSON object.",
-            })
-
-        # Validate the action sequence via WebSocket
-        sequence = script_config.get("sequence", [])
+        # Verify the script exists. When a preview will be shown, validate
+        # the action sequence concurrently; the two requests are independent.
         validation_result = None
         try:
-            result = await ws.send_command(
-                "validate_config",
-                action=sequence,
-            )
-            validation_result = {
-                "valid": True,
-                "errors": [],
-                "warnings": [],
-            }
+            if skip_confirm:
+                await rest.get_script_config(script_id)
+            else:
+                _current, validation_result = await asyncio.gather(
+                    rest.get_script_config(script_id),
+                    _validate_sequence(ws, script_config.get("sequence", [])),
+                )
         except Exception as exc:
-            validation_result = {
-                "valid": False,
-                "errors": [str(exc)],
-                "warnings": [],
-            }
+            return json_util.dumps({
+                "success": False,
+                "error": f"Script '{script_id}' not found: {exc}",
+            })
 
         # Dry-run confirmation
         confirmed = await confirm_change(
@@ -249,7 +230,7 @@ def register_script_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "success": False,
                 "error": "Change cancelled by user.",
             })
@@ -258,14 +239,10 @@ def register_script_tools(mcp_server):
         await rest.save_script_config(script_id, script_config)
 
         # Reload scripts
-        await ws.send_command(
-            "call_service",
-            domain="script",
-            service="reload",
-        )
+        await ws.reload("script")
 
         logger.info("Updated script: %s", script_id)
-        return json.dumps({
+        return json_util.dumps({
             "success": True,
             "script_id": script_id,
             "entity_id": f"script.{script_id}",
@@ -293,7 +270,7 @@ def register_script_tools(mcp_server):
         try:
             current_config = await rest.get_script_config(script_id)
         except Exception as exc:
-            return json.dumps({
+            return json_util.dumps({
                 "success": False,
                 "error": f"Script '{script_id}' not found: {exc}",
             })
@@ -309,7 +286,7 @@ def register_script_tools(mcp_server):
         )
 
         if not confirmed:
-            return json.dumps({
+            return json_util.dumps({
                 "success": False,
                 "error": "Change cancelled by user.",
             })
@@ -318,14 +295,10 @@ def register_script_tools(mcp_server):
         await rest.delete_script_config(script_id)
 
         # Reload scripts
-        await ws.send_command(
-            "call_service",
-            domain="script",
-            service="reload",
-        )
+        await ws.reload("script")
 
         logger.info("Deleted script: %s", script_id)
-        return json.dumps({
+        return json_util.dumps({
             "success": True,
             "script_id": script_id,
             "message": f"Script '{script_id}' deleted and reloaded successfully.",
@@ -1,11 +1,11 @@
 """State tools for reading Home Assistant entity states, history, logs, and templates."""
 
-import json
 import logging
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,12 @@ def register_state_tools(mcp_server):
         overview of the system state.
         """
         _ws, rest = get_clients(ctx)
-        states = await rest.get_states()
-
         if domain:
-            prefix = f"{domain}."
-            states = [s for s in states if s.get("entity_id", "").startswith(prefix)]
+            states = await rest.get_states_by_domain(domain)
+        else:
+            states = await rest.get_states()
 
-        return json.dumps(states, indent=2)
+        return json_util.dumps(states)
 
     @mcp_server.tool()
     async def get_entity_state(ctx: Context, entity_id: str) -> str:
@@ -47,7 +46,7 @@ def register_state_tools(mcp_server):
         """
         _ws, rest = get_clients(ctx)
         state = await rest.get_state(entity_id)
-        return json.dumps(state, indent=2)
+        return json_util.dumps(state)
 
     @mcp_server.tool()
     async def get_entity_history(
@@ -55,6 +54,8 @@ def register_state_tools(mcp_server):
         entity_id: str,
         start_time: str | None = None,
         end_time: str | None = None,
+        include_attributes: bool = True,
+        minimal: bool = False,
     ) -> str:
         """Get the state change history of a Home Assistant entity.
 
@@ -68,13 +69,23 @@ def register_state_tools(mcp_server):
                 period (e.g. '2024-01-15T08:00:00Z'). Defaults to 1 day ago.
             end_time: Optional ISO 8601 datetime string for the end of the period.
                 Defaults to now.
+            include_attributes: Set to false to omit attributes from each
+                record. Much smaller output for chatty sensors.
+            minimal: Set to true to return only the state and last_changed
+                for all but the first and last records.
 
         This is useful for analysing trends, debugging automations, or
         understanding how an entity's state has changed over a given period.
         """
         _ws, rest = get_clients(ctx)
-        history = await rest.get_history(entity_id, start_time, end_time)
-        return json.dumps(history, indent=2)
+        history = await rest.get_history(
+            entity_id,
+            start_time,
+            end_time,
+            minimal_response=minimal,
+            no_attributes=not include_attributes,
+        )
+        return json_util.dumps(history)
 
     @mcp_server.tool()
     async def get_logbook(
@@ -102,7 +113,7 @@ def register_state_tools(mcp_server):
         """
         _ws, rest = get_clients(ctx)
         logbook = await rest.get_logbook(entity_id, start_time, end_time)
-        return json.dumps(logbook, indent=2)
+        return json_util.dumps(logbook)
 
     @mcp_server.tool()
     async def get_error_log(ctx: Context) -> str:
@@ -1,17 +1,18 @@
 """Proactive intelligence tools that leverage the entity analysis engine."""
 
-import json
 import logging
 
 from fastmcp import Context
 
 from ha_mcp.util.context import get_clients
+from ha_mcp.util import json_util
 from ha_mcp.util.entity_analysis import (
     analyze_coverage,
     generate_suggestions,
     detect_conflicts,
     suggest_dashboard_layout,
 )
+from ha_mcp.util.registry_cache import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +25,16 @@ def register_suggestion_tools(mcp_server):
     # ------------------------------------------------------------------
 
     async def _fetch_entities(ws):
-        """Fetch the full entity registry via WebSocket."""
-        return await ws.send_command("config/entity_registry/list")
+        """Fetch the full entity registry (cached for a short TTL)."""
+        return await get_registry(ws, "entity")
 
     async def _fetch_areas(ws):
-        """Fetch the area registry via WebSocket."""
-        return await ws.send_command("config/area_registry/list")
+        """Fetch the area registry (cached for a short TTL)."""
+        return await get_registry(ws, "area")
 
     async def _fetch_automation_states(rest):
         """Fetch all automation.* states from the REST API."""
-        states = await rest.get_states()
-        return [s for s in states if s.get("entity_id", "").startswith("automation.")]
+        return await rest.get_states_by_domain("automation")
 
     async def _fetch_automation_configs(rest, automation_states):
         """Fetch full configs for a list of automation states.
@@ -111,7 +111,7 @@ def register_suggestion_tools(mcp_server):
                     area_coverage[key] = value
             coverage = area_coverage
 
-        return json.dumps(coverage, indent=2, default=str)
+        return json_util.dumps(coverage, default=str)
 
     @mcp_server.tool()
     async def suggest_automations(
@@ -150,7 +150,7 @@ def register_suggestion_tools(mcp_server):
             target_entity_id=entity_id,
         )
 
-        return json.dumps(suggestions, indent=2, default=str)
+        return json_util.dumps(suggestions, default=str)
 
     @mcp_server.tool()
     async def detect_automation_conflicts(ctx: Context) -> str:
@@ -173,7 +173,7 @@ def register_suggestion_tools(mcp_server):
 
         conflicts = detect_conflicts(automations)
 
-        return json.dumps(conflicts, indent=2, default=str)
+        return json_util.dumps(conflicts, default=str)
 
     @mcp_server.tool()
     async def suggest_dashboard(
@@ -200,4 +200,4 @@ def register_suggestion_tools(mcp_server):
 
         layout = suggest_dashboard_layout(entities, areas, target_area_id=area_id)
 
-        return json.dumps(layout, indent=2, default=str)
+        return json_util.dumps(layout, default=str)
@@ -1,4 +1,8 @@
+import asyncio
+import inspect
 import logging
+from collections.abc import Awaitable
+
 import yaml
 from fastmcp import Context
 
@@ -10,7 +14,7 @@ async def confirm_change(
     entity_type: str,
     identifier: str,
     config: dict,
-    validation_result: dict | None = None,
+    validation_result: dict | Awaitable[dict] | None = None,
     skip_confirm: bool = False,
 ) -> bool:
     """Show YAML preview and ask for confirmation before applying changes.
@@ -21,17 +25,39 @@ async def confirm_change(
         entity_type: Type of entity (automation, script, scene, etc.)
         identifier: Entity identifier
         config: Configuration to preview
-        validation_result: Optional validation results to include
+        validation_result: Optional validation results to include, or an
+            awaitable producing them; it is awaited after the preview is
+            rendered so the two overlap
         skip_confirm: Skip confirmation (for clients without elicitation)
 
     Returns:
         True if confirmed, False if cancelled.
     """
     if skip_confirm:
+        if inspect.iscoroutine(validation_result):
+            validation_result.close()
         logger.info("Skipping confirmation for %s %s: %s", action, entity_type, identifier)
         return True
 
-    yaml_preview = yaml.dump(config, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    if inspect.isawaitable(validation_result):
+        pending = asyncio.ensure_future(validation_result)
+    else:
+        pending = None
+
+    try:
+        if pending is not None:
+            # Yield once so the validation request goes out before the
+            # preview is rendered.
+            await asyncio.sleep(0)
+        yaml_preview = yaml.dump(config, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    except BaseException:
+        # Don't leave the validation running unobserved.
+        if pending is not None:
+            pending.cancel()
+        raise
+
+    if pending is not None:
+        validation_result = await pending
 
     message_parts = [
         f"## {action.upper()} {entity_type}: {identifier}",
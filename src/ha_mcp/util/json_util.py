@@ -0,0 +1,45 @@
+"""JSON helpers for tool input and output, backed by orjson."""
+
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from ha_mcp.config import settings
+
+JSONDecodeError = orjson.JSONDecodeError
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+_PRETTY_OPTIONS = _OPTIONS | orjson.OPT_INDENT_2
+_DEFAULT_OPTIONS = _PRETTY_OPTIONS if settings.pretty_json else _OPTIONS
+
+def dumps(
+    data: Any,
+    *,
+    pretty: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Serialize data to a JSON string.
+
+    Output is compact unless *pretty* is set or ``HA_MCP_PRETTY_JSON`` is on.
+    *default* converts objects orjson cannot serialize natively.
+    """
+    return orjson.dumps(
+        data,
+        default=default,
+        option=_PRETTY_OPTIONS if pretty else _DEFAULT_OPTIONS,
+    ).decode()
+
+def dumps_raw(body: bytes) -> str:
+    """Return an already-serialized JSON body as tool output.
+
+    The body is passed through as-is unless ``HA_MCP_PRETTY_JSON`` is on,
+    in which case it is re-indented.
+    """
+    if settings.pretty_json:
+        return orjson.dumps(orjson.loads(body), option=_PRETTY_OPTIONS).decode()
+    return body.decode()
+
+def loads(text: str | bytes) -> Any:
+    """Parse a JSON string. Raises JSONDecodeError on invalid input."""
+    return orjson.loads(text)
@@ -0,0 +1,232 @@
+"""Short-lived cache for the Home Assistant registry list commands.
+
+The device, entity, area, floor, and label registries change rarely, so
+their ``config/<name>_registry/list`` responses are held for a short TTL and
+dropped as soon as Home Assistant fires the matching
+``<name>_registry_updated`` event. Entries fetched before a WebSocket
+reconnect are not reused, since update events may have been missed while
+the connection was down.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ha_mcp.util import json_util
+
+logger = logging.getLogger(__name__)
+
+_REGISTRY_TTL = 30.0
+_REGISTRIES = ("device", "entity", "area", "floor", "label")
+
+# registry name -> (expiry, list response, values derived from it: indexes,
+# search texts, and the serialized list, connection epoch it was fetched
+# under). All of it is shared between callers and must not be mutated.
+_cache: dict[str, tuple[float, list, dict[str, Any], int]] = {}
+# Bumped on every update event so a fetch that raced an update is not cached.
+_generation: dict[str, int] = dict.fromkeys(_REGISTRIES, 0)
+_subscribed: set[int] = set()
+
+
+def _invalidator(name: str):
+    def handler(_event: dict) -> None:
+        _generation[name] += 1
+        _cache.pop(name, None)
+
+    return handler
+
+
+async def _subscribe(ws) -> None:
+    """Subscribe *ws* to the registry update events, once per client."""
+    if id(ws) in _subscribed:
+        return
+    _subscribed.add(id(ws))
+    results = await asyncio.gather(
+        *(
+            ws.subscribe_events(_invalidator(name), f"{name}_registry_updated")
+            for name in _REGISTRIES
+        ),
+        return_exceptions=True,
+    )
+    for name, result in zip(_REGISTRIES, results):
+        # A failed subscription is retried on reconnect; until then the TTL
+        # alone bounds staleness.
+        if isinstance(result, Exception):
+            logger.warning(
+                "Could not subscribe to %s_registry_updated: %s", name, result
+            )
+
+
+async def get_registry(ws, name: str) -> list:
+    """Return the ``config/<name>_registry/list`` response, cached.
+
+    Args:
+        ws: The WebSocket client.
+        name: Registry name: ``"device"``, ``"entity"``, ``"area"``,
+            ``"floor"``, or ``"label"``.
+    """
+    await _subscribe(ws)
+    epoch = ws.connection_epoch
+    entry = _cache.get(name)
+    if entry is not None and entry[0] > time.monotonic() and entry[3] == epoch:
+        return entry[1]
+    generation = _generation[name]
+    result = await ws.send_command(f"config/{name}_registry/list")
+    if _generation[name] == generation and ws.connection_epoch == epoch:
+        _cache[name] = (time.monotonic() + _REGISTRY_TTL, result, {}, epoch)
+    return result
+
+
+def _derived(name: str, registry: list, key: str, build: Callable[[list], Any]) -> Any:
+    """Return ``build(registry)``, cached alongside *registry* under *key*."""
+    entry = _cache.get(name)
+    if entry is None or entry[1] is not registry:
+        # The list was not cached (a registry update raced the fetch).
+        return build(registry)
+    value = entry[2].get(key)
+    if value is None:
+        value = entry[2][key] = build(registry)
+    return value
+
+
+async def get_registry_json(ws, name: str) -> str:
+    """Return the *name* registry list serialized as tool output, cached."""
+    registry = await get_registry(ws, name)
+    return _derived(name, registry, "json", json_util.dumps)
+
+
+def _build_search_texts(entities: list) -> list[str]:
+    """Lowercase ``entity_id``, ``name``, and ``original_name`` per entity.
+
+    The fields are joined with NUL, which no search query contains, so a
+    match never spans two fields.
+    """
+    return [
+        "\0".join((
+            entity.get("entity_id") or "",
+            entity.get("name") or "",
+            entity.get("original_name") or "",
+        )).lower()
+        for entity in entities
+    ]
+
+
+def _build_trigram_index(texts: list[str]) -> dict[str, list[int]]:
+    """Map each trigram of the search texts to entity positions.
+
+    Position lists are ascending, so candidates come back in registry order.
+    """
+    index: dict[str, list[int]] = {}
+    for position, text in enumerate(texts):
+        for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+            index.setdefault(gram, []).append(position)
+    return index
+
+
+def _trigram_candidates(
+    index: dict[str, list[int]], query: str, total: int
+) -> list[int] | None:
+    """Return the ascending positions whose text has every trigram of *query*.
+
+    Returns None when even the rarest trigram occurs in over a quarter of
+    the *total* texts; scanning them all is cheaper than intersecting.
+    """
+    postings = []
+    for gram in {query[i:i + 3] for i in range(len(query) - 2)}:
+        positions = index.get(gram)
+        if positions is None:
+            return []
+        postings.append(positions)
+    postings.sort(key=len)
+    if len(postings[0]) * 4 > total:
+        return None
+    candidates = set(postings[0])
+    for positions in postings[1:]:
+        candidates.intersection_update(positions)
+        if not candidates:
+            return []
+    return sorted(candidates)
+
+
+def _build_entity_index(entities: list, field: str) -> dict:
+    if field == "entity_id":
+        return {entity.get("entity_id"): entity for entity in entities}
+    if field == "search_text":
+        return _build_search_texts(entities)
+    if field == "trigram":
+        return _build_trigram_index(_entity_index(entities, "search_text"))
+    index: dict[str, list] = {}
+    if field == "domain":
+        for entity in entities:
+            domain = (entity.get("entity_id") or "").partition(".")[0]
+            index.setdefault(domain, []).append(entity)
+    else:
+        for entity in entities:
+            index.setdefault(entity.get(field), []).append(entity)
+    return index
+
+
+def _entity_index(entities: list, field: str) -> dict:
+    return _derived(
+        "entity", entities, field,
+        lambda registry: _build_entity_index(registry, field),
+    )
+
+
+async def get_entity_index(ws, field: str) -> dict[str, list]:
+    """Return the entity registry grouped by *field*, cached with the list.
+
+    Args:
+        ws: The WebSocket client.
+        field: ``"domain"`` (the part of ``entity_id`` before the dot),
+            ``"device_id"``, or ``"area_id"``.
+
+    The index is built on first use after each refresh of the entity
+    registry. Buckets keep registry order.
+    """
+    return _entity_index(await get_registry(ws, "entity"), field)
+
+
+async def search_entity_registry(
+    ws, query: str, domain: str | None = None
+) -> list:
+    """Return entities whose ID, name, or original name contains *query*.
+
+    Args:
+        ws: The WebSocket client.
+        query: Search string, matched case-insensitively.
+        domain: Optionally restrict matches to one domain.
+
+    Matches come back in registry order. The lowercased search texts are
+    precomputed per registry refresh. Queries of three or more characters
+    only check the candidates from a trigram index, unless those cover most
+    of the registry; other queries scan all texts.
+    """
+    entities = await get_registry(ws, "entity")
+    texts = _entity_index(entities, "search_text")
+    query = query.lower()
+    if "\0" in query:
+        return []
+    positions = None
+    if len(query) >= 3:
+        positions = _trigram_candidates(
+            _entity_index(entities, "trigram"), query, len(entities)
+        )
+    if positions is None:
+        positions = range(len(entities))
+    # Entity IDs are lowercase, so the domain prefix can be checked on the
+    # search text, which starts with the entity ID.
+    prefix = domain.removesuffix(".") + "." if domain else ""
+    return [
+        entities[i]
+        for i in positions
+        if query in texts[i] and texts[i].startswith(prefix)
+    ]
+
+
+async def get_entity_entry(ws, entity_id: str) -> dict | None:
+    """Return the entity registry entry for *entity_id*, or None if absent."""
+    index = _entity_index(await get_registry(ws, "entity"), "entity_id")
+    return index.get(entity_id)
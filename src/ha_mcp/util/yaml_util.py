@@ -1,6 +1,16 @@
+import logging
 import yaml
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader; it is many times faster on large documents.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    logger.warning("libyaml not available, YAML parsing uses the pure-Python loader")
+
 def to_yaml(data: Any, *, indent: int = 2) -> str:
     """Convert data to a nicely formatted YAML string."""
     return yaml.dump(
@@ -13,7 +23,7 @@ def to_yaml(data: Any, *, indent: int = 2) -> str:
 
 def from_yaml(text: str) -> Any:
     """Parse a YAML string safely."""
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=_SafeLoader)
 
 def validate_yaml_syntax(text: str) -> tuple[bool, str]:
     """Check if a string is valid YAML syntax.
@@ -21,7 +31,7 @@ def validate_yaml_syntax(text: str) -> tuple[bool, str]:
     Returns (is_valid, error_message).
     """
     try:
-        yaml.safe_load(text)
+        yaml.load(text, Loader=_SafeLoader)
         return True, ""
     except yaml.YAMLError as e:
         return False, str(e)
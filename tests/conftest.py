@@ -0,0 +1,13 @@
+import pytest
+
+from fakes import FakeHomeAssistant
+
+from ha_mcp.ha_client import websocket
+
+
+@pytest.fixture
+def ha(monkeypatch):
+    """A fake Home Assistant that ``HAWebSocketClient`` connects to."""
+    server = FakeHomeAssistant()
+    monkeypatch.setattr(websocket.aiohttp, "ClientSession", server.session)
+    return server
@@ -0,0 +1,145 @@
+"""An in-memory Home Assistant WebSocket server for client tests.
+
+``FakeHomeAssistant.session`` replaces ``aiohttp.ClientSession`` so that
+``HAWebSocketClient`` connects, authenticates, and reconnects through its
+real code paths without any network.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import orjson
+
+
+def result(msg: dict, value: Any = None) -> dict:
+    """A successful ``result`` reply to *msg*."""
+    return {"id": msg["id"], "type": "result", "success": True, "result": value}
+
+
+def error(msg: dict, code: str, message: str) -> dict:
+    """A failed ``result`` reply to *msg*."""
+    return {
+        "id": msg["id"],
+        "type": "result",
+        "success": False,
+        "error": {"code": code, "message": message},
+    }
+
+
+class FakeConnection:
+    """Stands in for ``aiohttp.ClientWebSocketResponse``."""
+
+    def __init__(self, server: "FakeHomeAssistant") -> None:
+        self.server = server
+        self.closed = False
+        self.subscriptions: dict[int, str | None] = {}
+        self._incoming: asyncio.Queue = asyncio.Queue()
+        self.push({"type": "auth_required"})
+
+    def push(self, msg: dict) -> None:
+        """Deliver *msg* to the client."""
+        self._incoming.put_nowait(
+            SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data=orjson.dumps(msg))
+        )
+
+    def drop(self) -> None:
+        """Close the connection from the server side."""
+        self.closed = True
+        self._incoming.put_nowait(
+            SimpleNamespace(type=aiohttp.WSMsgType.CLOSED, data=None)
+        )
+
+    def fire(self, event_type: str, data: dict) -> None:
+        """Push an event to every subscription that matches *event_type*."""
+        for sub_id, subscribed in self.subscriptions.items():
+            if subscribed in (None, event_type):
+                self.push({
+                    "id": sub_id,
+                    "type": "event",
+                    "event": {"event_type": event_type, "data": data},
+                })
+
+    async def send_str(self, data: str) -> None:
+        msg = orjson.loads(data)
+        if msg["type"] == "auth":
+            self.push({"type": "auth_ok", "ha_version": "2024.10.0"})
+            return
+        self.server.commands.append(msg)
+        if msg["type"] == "subscribe_events":
+            self.subscriptions[msg["id"]] = msg.get("event_type")
+        handler = self.server.handlers.get(msg["type"], self.server.default_reply)
+        reply = handler(msg)
+        if reply is not None:
+            self.push(reply)
+
+    async def receive_json(self, loads=orjson.loads) -> dict:
+        return loads((await self._incoming.get()).data)
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.drop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self._incoming.get()
+
+
+class FakeHomeAssistant:
+    """Answers the subset of the WebSocket API the client relies on.
+
+    ``handlers`` maps a message type to a function returning the reply for
+    a message, or None to leave it unanswered. Other types get an empty
+    successful result.
+    """
+
+    def __init__(self, states: list[dict] | None = None) -> None:
+        self.states = states or []
+        self.commands: list[dict] = []
+        self.connections: list[FakeConnection] = []
+        self.handlers = {"get_states": lambda msg: result(msg, self.states)}
+
+    @property
+    def connection(self) -> FakeConnection:
+        """The most recent connection."""
+        return self.connections[-1]
+
+    def default_reply(self, msg: dict) -> dict:
+        return result(msg)
+
+    def sent(self, msg_type: str) -> list[dict]:
+        """Commands of *msg_type* received so far, across connections."""
+        return [msg for msg in self.commands if msg["type"] == msg_type]
+
+    def session(self) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    """Stands in for ``aiohttp.ClientSession``."""
+
+    def __init__(self, server: FakeHomeAssistant) -> None:
+        self.server = server
+        self.closed = False
+
+    async def ws_connect(self, url: str) -> FakeConnection:
+        connection = FakeConnection(self.server)
+        self.server.connections.append(connection)
+        return connection
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def state(entity_id: str, value: str, **attributes: Any) -> dict:
+    """A state object as Home Assistant sends it."""
+    return {"entity_id": entity_id, "state": value, "attributes": attributes}
+
+
+async def settle(rounds: int = 5) -> None:
+    """Let queued messages reach the client's listener."""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
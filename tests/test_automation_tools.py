@@ -0,0 +1,147 @@
+"""Tests for the automation tools."""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from ha_mcp.ha_client.models import HAConnectionError
+from ha_mcp.tools import automation
+
+
+class _ToolServer:
+    """Collects tool functions the way ``mcp_server.tool()`` registers them."""
+
+    def __init__(self) -> None:
+        self.tools = {}
+
+    def tool(self):
+        def register(func):
+            self.tools[func.__name__] = func
+            return func
+
+        return register
+
+
+def _context(ws, rest):
+    return SimpleNamespace(
+        fastmcp=SimpleNamespace(_lifespan_result={"ws": ws, "rest": rest})
+    )
+
+
+class _FakeRest:
+    def __init__(self, ids, broken=()):
+        self.states = [
+            {"entity_id": f"automation.a{i}", "attributes": {"id": auto_id}}
+            for i, auto_id in enumerate(ids)
+        ]
+        # A YAML automation without an internal ID.
+        self.states.append({"entity_id": "automation.yaml", "attributes": {}})
+        self.broken = set(broken)
+
+    async def get_states_by_domain(self, domain):
+        return self.states
+
+    async def get_automation_config(self, auto_id):
+        if auto_id in self.broken:
+            raise HAConnectionError(f"HTTP 500 for {auto_id}")
+        return {"id": auto_id, "alias": auto_id.upper()}
+
+
+_VALID = {
+    section: {"valid": True, "error": None}
+    for section in ("trigger", "condition", "action")
+}
+_INVALID = {
+    **_VALID,
+    "action": {"valid": False, "error": "Entity light.new not found"},
+}
+
+
+class _FakeValidatorWS:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def send_command(self, msg_type, **fields):
+        assert msg_type == "validate_config"
+        self.calls += 1
+        return orjson.loads(orjson.dumps(self.result))
+
+
+@pytest.fixture(autouse=True)
+def _empty_validate_cache():
+    automation._validate_cache.clear()
+    yield
+    automation._validate_cache.clear()
+
+
+def _validate(ws, action):
+    return asyncio.run(
+        automation._validate_config(ws, trigger=[], condition=[], action=action)
+    )
+
+
+def test_validate_config_reuses_result_for_identical_config():
+    ws = _FakeValidatorWS(_VALID)
+    assert _validate(ws, [{"service": "light.turn_on"}]) == _VALID
+    assert _validate(ws, [{"service": "light.turn_on"}]) == _VALID
+    assert ws.calls == 1
+    _validate(ws, [{"service": "light.turn_off"}])
+    assert ws.calls == 2
+
+
+def test_validate_config_does_not_cache_failures():
+    ws = _FakeValidatorWS(_INVALID)
+    assert _validate(ws, [{"service": "light.turn_on"}]) == _INVALID
+    # The user adds the missing entity; the same config now passes.
+    ws.result = _VALID
+    assert _validate(ws, [{"service": "light.turn_on"}]) == _VALID
+    assert ws.calls == 2
+
+
+def test_validate_config_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        automation, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    ws = _FakeValidatorWS(_VALID)
+    _validate(ws, [])
+    now[0] += automation._VALIDATE_CACHE_TTL - 1
+    _validate(ws, [])
+    assert ws.calls == 1
+    now[0] += 2
+    _validate(ws, [])
+    assert ws.calls == 2
+
+
+def test_validate_config_returns_independent_copies():
+    ws = _FakeValidatorWS(_VALID)
+    first = _validate(ws, [])
+    first["action"]["valid"] = False
+    first["extra"] = True
+    assert _validate(ws, []) == _VALID
+    assert ws.calls == 1
+
+
+def test_get_all_automation_configs_pages_and_reports_failures():
+    server = _ToolServer()
+    automation.register_automation_tools(server)
+    get_all = server.tools["get_all_automation_configs"]
+    rest = _FakeRest(["a", "b", "c", "d", "e"], broken={"b"})
+    ctx = _context(None, rest)
+
+    async def run():
+        first = orjson.loads(await get_all(ctx, limit=3))
+        assert list(first["configs"]) == ["a", "c"]
+        assert first["failed"] == ["b"]
+        assert first["total"] == 5
+        assert first["truncated"] is True
+
+        rest_page = orjson.loads(await get_all(ctx, limit=3, offset=3))
+        assert list(rest_page["configs"]) == ["d", "e"]
+        assert rest_page["failed"] == []
+        assert rest_page["truncated"] is False
+
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+"""Tests for the dry-run confirmation helper."""
+
+import asyncio
+
+import pytest
+
+from ha_mcp.util import dry_run
+from ha_mcp.util.dry_run import confirm_change
+
+
+def test_failed_preview_cancels_pending_validation(monkeypatch):
+    def broken_dump(*args, **kwargs):
+        raise ValueError("cannot render")
+
+    monkeypatch.setattr(dry_run.yaml, "dump", broken_dump)
+
+    async def run():
+        cancelled = asyncio.Event()
+
+        async def validate():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {"valid": True}
+
+        with pytest.raises(ValueError):
+            await confirm_change(
+                None, "create", "automation", "a1", {}, validation_result=validate()
+            )
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    asyncio.run(run())
+
+
+def test_skip_confirm_does_not_run_validation():
+    async def run():
+        started = False
+
+        async def validate():
+            nonlocal started
+            started = True
+            return {"valid": True}
+
+        assert await confirm_change(
+            None, "create", "automation", "a1", {},
+            validation_result=validate(), skip_confirm=True,
+        )
+        assert not started
+
+    asyncio.run(run())
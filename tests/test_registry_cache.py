@@ -0,0 +1,122 @@
+"""Tests for the registry list cache."""
+
+import asyncio
+
+import pytest
+
+from fakes import result, settle
+
+from ha_mcp.ha_client.websocket import HAWebSocketClient
+from ha_mcp.util import registry_cache
+
+
+class _RegistryWS:
+    """Answers registry list commands and records event subscriptions."""
+
+    connection_epoch = 1
+
+    def __init__(self):
+        self.handlers = {}
+        self.fetches = 0
+        self.version = 0
+        self.gate: asyncio.Event | None = None
+
+    async def subscribe_events(self, handler, event_type=None):
+        self.handlers[event_type] = handler
+
+    async def send_command(self, msg_type, **fields):
+        assert msg_type == "config/area_registry/list"
+        self.fetches += 1
+        areas = [{"area_id": "kitchen", "version": self.version}]
+        if self.gate is not None:
+            await self.gate.wait()
+        return areas
+
+    def fire(self, event_type):
+        self.handlers[event_type]({"event_type": event_type, "data": {}})
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry_cache():
+    registry_cache._cache.clear()
+    registry_cache._subscribed.clear()
+    yield
+    registry_cache._cache.clear()
+    registry_cache._subscribed.clear()
+
+
+def test_update_event_drops_cached_registry():
+    ws = _RegistryWS()
+
+    async def run():
+        first = await registry_cache.get_registry(ws, "area")
+        assert await registry_cache.get_registry(ws, "area") is first
+        assert ws.fetches == 1
+
+        # Other registries' events leave the entry alone.
+        ws.fire("device_registry_updated")
+        assert await registry_cache.get_registry(ws, "area") is first
+
+        ws.version = 1
+        ws.fire("area_registry_updated")
+        assert await registry_cache.get_registry(ws, "area") == [
+            {"area_id": "kitchen", "version": 1}
+        ]
+        assert ws.fetches == 2
+
+    asyncio.run(run())
+
+
+def test_fetch_racing_an_update_is_not_cached():
+    ws = _RegistryWS()
+
+    async def run():
+        ws.gate = asyncio.Event()
+        fetch = asyncio.ensure_future(registry_cache.get_registry(ws, "area"))
+        await settle()
+        # The registry changes while the list is on its way.
+        ws.fire("area_registry_updated")
+        ws.gate.set()
+        assert await fetch == [{"area_id": "kitchen", "version": 0}]
+        assert "area" not in registry_cache._cache
+
+        ws.version = 1
+        assert (await registry_cache.get_registry(ws, "area"))[0]["version"] == 1
+        assert ws.fetches == 2
+        assert "area" in registry_cache._cache
+
+    asyncio.run(run())
+
+
+def test_reconnect_drops_cached_registries(ha):
+    version = [0]
+    ha.handlers["config/area_registry/list"] = lambda msg: result(
+        msg, [{"area_id": "kitchen", "version": version[0]}]
+    )
+
+    async def area_version(client):
+        return (await registry_cache.get_registry(client, "area"))[0]["version"]
+
+    async def run():
+        client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+        await client.connect()
+        client._reconnect_delay = 0
+        try:
+            assert await area_version(client) == 0
+            assert await area_version(client) == 0
+            assert len(ha.sent("config/area_registry/list")) == 1
+
+            # The area changes while the connection is down, so the update
+            # event never arrives.
+            ha.connection.drop()
+            version[0] = 1
+            async with asyncio.timeout(1):
+                while len(ha.connections) < 2 or not client._state_cache_ready:
+                    await settle()
+
+            assert await area_version(client) == 1
+            assert len(ha.sent("config/area_registry/list")) == 2
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
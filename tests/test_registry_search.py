@@ -0,0 +1,108 @@
+"""Tests for the entity registry search against a plain substring scan."""
+
+import asyncio
+
+import pytest
+
+from ha_mcp.util import registry_cache
+
+
+class _RegistryWS:
+    connection_epoch = 1
+
+    def __init__(self, entities):
+        self.entities = entities
+
+    async def subscribe_events(self, handler, event_type=None):
+        pass
+
+    async def send_command(self, msg_type, **fields):
+        assert msg_type == "config/entity_registry/list"
+        return self.entities
+
+
+def _entity(entity_id, name=None, original_name=None):
+    return {"entity_id": entity_id, "name": name, "original_name": original_name}
+
+
+_ENTITIES = [
+    *(
+        _entity(f"sensor.temperature_{i}", original_name=f"Temperature {i}")
+        for i in range(12)
+    ),
+    _entity("light.kitchen_ceiling", name="Kitchen Ceiling"),
+    _entity("switch.kitchen_kettle", original_name="Kettle"),
+    _entity("light.garage", name=None, original_name="Garage Light"),
+    _entity("cover.garage_door", name="Garage Door"),
+    # "abc" ends the entity ID and "def" starts the name: "abcdef" is only
+    # found if the fields are concatenated.
+    _entity("sensor.abc", name="def sensor"),
+    _entity("binary_sensor.la_door", original_name=None),
+]
+
+
+def _scan(query, domain=None):
+    """The linear scan the index replaced."""
+    query = query.lower()
+    prefix = domain.removesuffix(".") + "." if domain else ""
+    return [
+        entity
+        for entity in _ENTITIES
+        if entity["entity_id"].startswith(prefix)
+        and (
+            query in entity["entity_id"]
+            or query in (entity["name"] or "").lower()
+            or query in (entity["original_name"] or "").lower()
+        )
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry_cache():
+    registry_cache._cache.clear()
+    registry_cache._subscribed.clear()
+    yield
+    registry_cache._cache.clear()
+    registry_cache._subscribed.clear()
+
+
+def _search(query, domain=None):
+    ws = _RegistryWS(_ENTITIES)
+    return asyncio.run(registry_cache.search_entity_registry(ws, query, domain))
+
+
+@pytest.mark.parametrize(
+    ("query", "domain"),
+    [
+        # Shorter than a trigram: full scan.
+        ("la", None),
+        ("k", None),
+        # Mixed case.
+        ("KiTcHeN", None),
+        ("GARAGE light", None),
+        # Domain filter, with and without the trailing dot.
+        ("kitchen", "light"),
+        ("garage", "cover."),
+        ("door", "binary_sensor"),
+        # Would only match across the NUL separator.
+        ("abcdef", None),
+        ("abc\0def", None),
+        # Selective query answered from trigram candidates.
+        ("kettle", None),
+        ("nothing like it", None),
+    ],
+)
+def test_search_matches_linear_scan(query, domain):
+    expected = [] if "\0" in query else _scan(query, domain)
+    assert _search(query, domain) == expected
+
+
+def test_unselective_query_falls_back_to_full_scan():
+    texts = registry_cache._build_search_texts(_ENTITIES)
+    index = registry_cache._build_trigram_index(texts)
+    assert registry_cache._trigram_candidates(index, "temperature", len(texts)) is None
+    assert registry_cache._trigram_candidates(index, "kettle", len(texts)) is not None
+
+    assert _search("temperature") == _scan("temperature")
+    assert _search("Temperature 1") == _scan("Temperature 1")
+    assert _search("temperature", "light") == []
@@ -0,0 +1,77 @@
+"""Tests for the REST client's response cache."""
+
+import asyncio
+
+import orjson
+
+from ha_mcp.ha_client.rest import HARestClient
+
+
+class _FakeServer:
+    """Stands in for ``HARestClient._fetch`` with one stored config.
+
+    A GET reads the stored body when it arrives but only answers once
+    ``release`` is set, so a write can land while it is in flight.
+    """
+
+    def __init__(self) -> None:
+        self.body = orjson.dumps({"alias": "old"})
+        self.release = asyncio.Event()
+        self.received = asyncio.Event()
+        self.gets = 0
+
+    async def fetch(self, method: str, path: str, **kwargs) -> tuple[str, bytes]:
+        if method == "GET":
+            self.gets += 1
+            body = self.body
+            self.received.set()
+            await self.release.wait()
+            return "application/json", body
+        self.body = orjson.dumps(kwargs["json"])
+        return "application/json", b'{"result": "ok"}'
+
+
+def test_read_after_write_does_not_join_stale_fetch():
+    async def run():
+        client = HARestClient("http://ha.local:8123", "token")
+        server = _FakeServer()
+        client._fetch = server.fetch
+
+        stale_read = asyncio.ensure_future(client.get_automation_config("a1"))
+        await server.received.wait()
+        await client.save_automation_config("a1", {"alias": "new"})
+
+        server.received.clear()
+        fresh_read = asyncio.ensure_future(client.get_automation_config("a1"))
+        # Joining the pre-write GET would never send a new request.
+        await asyncio.wait_for(server.received.wait(), 1)
+        server.release.set()
+
+        assert await stale_read == {"alias": "old"}
+        assert await fresh_read == {"alias": "new"}
+        assert server.gets == 2
+        # Only the post-write body may be cached.
+        assert await client.get_automation_config("a1") == {"alias": "new"}
+        assert server.gets == 2
+
+    asyncio.run(run())
+
+
+def test_concurrent_reads_share_one_fetch():
+    async def run():
+        client = HARestClient("http://ha.local:8123", "token")
+        server = _FakeServer()
+        client._fetch = server.fetch
+
+        reads = [
+            asyncio.ensure_future(client.get_automation_config("a1"))
+            for _ in range(3)
+        ]
+        await server.received.wait()
+        await asyncio.sleep(0)
+        server.release.set()
+
+        assert await asyncio.gather(*reads) == [{"alias": "old"}] * 3
+        assert server.gets == 1
+
+    asyncio.run(run())
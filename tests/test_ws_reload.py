@@ -0,0 +1,94 @@
+"""Tests for coalesced domain reloads."""
+
+import asyncio
+import gc
+
+import pytest
+
+from fakes import error
+
+from ha_mcp.ha_client.models import HAConnectionError
+from ha_mcp.ha_client.websocket import _RELOAD_DEBOUNCE, HAWebSocketClient
+
+
+async def _connect(ha):
+    client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+    await client.connect()
+    return client
+
+
+def test_reloads_within_window_share_one_call(ha):
+    async def run():
+        client = await _connect(ha)
+        try:
+            first = asyncio.ensure_future(client.reload("automation"))
+            await asyncio.sleep(_RELOAD_DEBOUNCE / 5)
+            await asyncio.gather(first, client.reload("automation"))
+            [call] = ha.sent("call_service")
+            assert (call["domain"], call["service"]) == ("automation", "reload")
+
+            # Requested after the window closed: a new reload.
+            await client.reload("automation")
+            assert len(ha.sent("call_service")) == 2
+            # Other domains are never merged in.
+            await asyncio.gather(client.reload("script"), client.reload("automation"))
+            assert [msg["domain"] for msg in ha.sent("call_service")[2:]] == [
+                "script",
+                "automation",
+            ]
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_reload_error_reaches_every_waiter(ha):
+    ha.handlers["call_service"] = lambda msg: error(
+        msg, "home_assistant_error", "Invalid config"
+    )
+
+    async def run():
+        client = await _connect(ha)
+        try:
+            results = await asyncio.gather(
+                client.reload("script"),
+                client.reload("script"),
+                return_exceptions=True,
+            )
+            assert len(ha.sent("call_service")) == 1
+            for outcome in results:
+                assert isinstance(outcome, HAConnectionError)
+                assert "Invalid config" in str(outcome)
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_reload_error_is_retrieved_when_all_waiters_cancel(ha):
+    ha.handlers["call_service"] = lambda msg: error(
+        msg, "home_assistant_error", "Invalid config"
+    )
+    unhandled = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        client = await _connect(ha)
+        try:
+            waiter = asyncio.ensure_future(client.reload("scene"))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            # The shared reload still runs and fails.
+            await asyncio.sleep(_RELOAD_DEBOUNCE * 2)
+            assert len(ha.sent("call_service")) == 1
+            assert not client._pending_reloads
+            gc.collect()
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+    assert unhandled == []
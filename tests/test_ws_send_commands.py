@@ -0,0 +1,65 @@
+"""Tests for pipelined command batches."""
+
+import asyncio
+
+import pytest
+
+from fakes import error, result
+
+from ha_mcp.ha_client.models import HAConnectionError
+from ha_mcp.ha_client.websocket import HAWebSocketClient
+
+
+def _answer(msg):
+    if msg.get("name") == "broken":
+        return error(msg, "invalid_format", "Broken config")
+    if msg.get("name") == "silent":
+        return None
+    return result(msg, msg["name"])
+
+
+async def _connect(ha):
+    ha.handlers["probe"] = _answer
+    client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+    await client.connect()
+    return client
+
+
+_BATCH = [
+    {"type": "probe", "name": "ok"},
+    {"type": "probe", "name": "broken"},
+    {"type": "probe", "name": "silent"},
+]
+
+
+def test_send_commands_returns_failures_and_timeouts_in_place(ha):
+    async def run():
+        client = await _connect(ha)
+        try:
+            results = await client.send_commands(
+                _BATCH, timeout=0.05, return_exceptions=True
+            )
+            assert results[0] == "ok"
+            assert isinstance(results[1], HAConnectionError)
+            assert "Broken config" in str(results[1])
+            assert isinstance(results[2], TimeoutError)
+            assert not client._pending
+            assert not any(client._slots)
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_send_commands_raises_first_failure_without_return_exceptions(ha):
+    async def run():
+        client = await _connect(ha)
+        try:
+            with pytest.raises(HAConnectionError, match="Broken config"):
+                await client.send_commands(_BATCH, timeout=0.05)
+            with pytest.raises(TimeoutError):
+                await client.send_commands(_BATCH[2:], timeout=0.05)
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
@@ -0,0 +1,89 @@
+"""Tests for routing WebSocket replies through the response slot table."""
+
+import asyncio
+
+import pytest
+
+from fakes import result, settle
+
+from ha_mcp.ha_client.models import HAConnectionLost
+from ha_mcp.ha_client.websocket import _SLOT_COUNT, HAWebSocketClient
+
+
+async def _connect(ha):
+    # Commands of type "slow" are left for the test to answer.
+    ha.handlers["slow"] = lambda msg: None
+    client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+    await client.connect()
+    client._should_reconnect = False
+    return client
+
+
+async def _send_slow(client, ha, timeout=30.0):
+    task = asyncio.ensure_future(client.send_command("slow", timeout=timeout))
+    await settle()
+    return task, ha.sent("slow")[-1]
+
+
+def test_late_reply_to_timed_out_command_is_ignored(ha):
+    async def run():
+        client = await _connect(ha)
+        try:
+            with pytest.raises(TimeoutError):
+                await client.send_command("slow", timeout=0.01)
+            stale = ha.sent("slow")[-1]
+
+            # The next command reuses the timed-out command's slot.
+            client._msg_id = stale["id"] + _SLOT_COUNT - 1
+            task, current = await _send_slow(client, ha)
+            assert current["id"] & (_SLOT_COUNT - 1) == stale["id"] & (_SLOT_COUNT - 1)
+
+            ha.connection.push(result(stale, "late"))
+            await settle()
+            assert not task.done()
+
+            ha.connection.push(result(current, "fresh"))
+            assert await task == "fresh"
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_occupied_slot_spills_into_overflow(ha):
+    async def run():
+        client = await _connect(ha)
+        try:
+            first, first_msg = await _send_slow(client, ha)
+            client._msg_id = first_msg["id"] + _SLOT_COUNT - 1
+            second, second_msg = await _send_slow(client, ha)
+            assert second_msg["id"] in client._pending
+
+            ha.connection.push(result(second_msg, "second"))
+            assert await second == "second"
+            assert not client._pending
+            ha.connection.push(result(first_msg, "first"))
+            assert await first == "first"
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_fail_pending_fails_slot_and_overflow_futures(ha):
+    async def run():
+        client = await _connect(ha)
+        first, first_msg = await _send_slow(client, ha)
+        client._msg_id = first_msg["id"] + _SLOT_COUNT - 1
+        second, second_msg = await _send_slow(client, ha)
+        assert second_msg["id"] in client._pending
+
+        ha.connection.drop()
+        for task in (first, second):
+            with pytest.raises(HAConnectionLost):
+                await task
+        assert not client._pending
+        assert not any(client._slots)
+        await client.disconnect()
+
+    asyncio.run(run())
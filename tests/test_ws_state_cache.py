@@ -0,0 +1,102 @@
+"""Tests for the WebSocket client's event-driven state cache."""
+
+import asyncio
+
+import orjson
+
+from fakes import settle, state
+
+from ha_mcp.ha_client.rest import HARestClient
+from ha_mcp.ha_client.websocket import HAWebSocketClient
+
+
+def _changed(entity_id, new_state):
+    return {"entity_id": entity_id, "old_state": None, "new_state": new_state}
+
+
+def test_snapshot_seeds_cache_and_domain_index(ha):
+    ha.states = [
+        state("light.kitchen", "on"),
+        state("light.hall", "off"),
+        state("sensor.temp", "21"),
+    ]
+
+    async def run():
+        client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+        await client.connect()
+        try:
+            assert ha.sent("subscribe_events")[0]["event_type"] == "state_changed"
+            assert client.get_cached_state("light.hall") == ha.states[1]
+            assert client.get_cached_states() == ha.states
+            assert client.get_cached_states_by_domain("light") == ha.states[:2]
+            assert client.get_cached_states_by_domain("switch") == []
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_state_changed_updates_and_removes_entries(ha):
+    ha.states = [state("light.kitchen", "on")]
+
+    async def run():
+        client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+        await client.connect()
+        try:
+            off = state("light.kitchen", "off")
+            fan = state("fan.attic", "on")
+            ha.connection.fire("state_changed", _changed("light.kitchen", off))
+            ha.connection.fire("state_changed", _changed("fan.attic", fan))
+            await settle()
+            assert client.get_cached_state("light.kitchen") == off
+            assert client.get_cached_states_by_domain("light") == [off]
+            assert client.get_cached_states_by_domain("fan") == [fan]
+
+            ha.connection.fire("state_changed", _changed("light.kitchen", None))
+            await settle()
+            assert "light.kitchen" not in client._state_cache
+            assert "light.kitchen" not in client._domain_index["light"]
+            assert client.get_cached_state("light.kitchen") is None
+            assert client.get_cached_states() == [fan]
+            assert client.get_cached_states_by_domain("light") == []
+        finally:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_cache_goes_cold_on_disconnect_and_rest_takes_over(ha):
+    ha.states = [state("light.kitchen", "on")]
+    http_state = state("light.kitchen", "off")
+
+    async def run():
+        client = HAWebSocketClient("ws://ha.local/api/websocket", "token")
+        await client.connect()
+        # Stay down after the drop instead of reconnecting.
+        client._should_reconnect = False
+
+        rest = HARestClient("http://ha.local:8123", "token")
+        rest.use_state_cache(client)
+        fetched = []
+
+        async def fetch(method, path, **kwargs):
+            fetched.append(path)
+            return "application/json", orjson.dumps(http_state)
+
+        rest._fetch = fetch
+
+        assert await rest.get_state("light.kitchen") == ha.states[0]
+        assert fetched == []
+
+        ha.connection.drop()
+        await settle()
+        assert not client.connected
+        assert client.get_cached_state("light.kitchen") is None
+        assert client.get_cached_states() is None
+        assert client.get_cached_states_by_domain("light") is None
+
+        assert await rest.get_state("light.kitchen") == http_state
+        assert fetched == ["/api/states/light.kitchen"]
+        await client.disconnect()
+
+    asyncio.run(run())